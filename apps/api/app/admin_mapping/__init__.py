@@ -7,6 +7,7 @@ from .router import router
 from .service import AdminMappingService, ValidationError
 from .models import (
     CreateMappingEventRequest,
+    MappingEventData,
     ApproveEventRequest,
     RejectEventRequest,
     SnoozeEventRequest,
@@ -20,6 +21,7 @@ __all__ = [
     "AdminMappingService",
     "ValidationError",
     "CreateMappingEventRequest",
+    "MappingEventData",
     "ApproveEventRequest",
     "RejectEventRequest",
     "SnoozeEventRequest",
@@ -3,10 +3,142 @@ Admin Mapping Integration
 Helper functions to populate mapping_event_queue from compare/clarify flows
 """
 
+import asyncio
+import logging
 import asyncpg
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from .service import AdminMappingService
-from .models import CreateMappingEventRequest, DetectedStatus
+from .models import MappingEventData, DetectedStatus
+
+logger = logging.getLogger(__name__)
+
+
+# Queue sentinel: flush what is pending, then end the flush task
+_STOP = object()
+
+
+class MappingEventWriter:
+    """
+    Background batch writer for mapping events.
+
+    Events are enqueued (with the pool they must be written to) from the
+    compare flow and flushed by a single task: up to max_batch events, or
+    whatever arrived within flush_interval seconds, are written with one
+    AdminMappingService.create_or_update_events() call per pool, on one
+    acquired connection. The service for each pool is built once and kept.
+    Deduplication semantics are the same as create_or_update_event.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 100,
+        flush_interval: float = 0.05,
+    ):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Tuple[asyncpg.Pool, MappingEventData]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        # One service per target pool, built on first use and kept
+        self._services: Dict[asyncpg.Pool, AdminMappingService] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the flush task on the running event loop."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """
+        Stop the flush task and write any events still queued.
+
+        The task is not cancelled: it drains up to the sentinel and finishes
+        its in-flight write, so no batch taken off the queue is lost.
+        """
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+
+        # Events enqueued behind the sentinel
+        remaining = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remaining.append(item)
+        if remaining:
+            await self._write(remaining)
+
+    def enqueue(self, db_pool: asyncpg.Pool, event: MappingEventData) -> None:
+        self._queue.put_nowait((db_pool, event))
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Tuple[asyncpg.Pool, MappingEventData]]) -> None:
+        # Group by target pool (insertion order kept)
+        events_by_pool: Dict[asyncpg.Pool, List[MappingEventData]] = {}
+        for db_pool, event in batch:
+            events_by_pool.setdefault(db_pool, []).append(event)
+
+        for db_pool, events in events_by_pool.items():
+            try:
+                # One connection for the whole drained batch
+                service = self._services.get(db_pool)
+                if service is None:
+                    service = self._services[db_pool] = AdminMappingService(db_pool)
+                async with db_pool.acquire() as conn:
+                    await service.create_or_update_events(events, conn=conn)
+            except Exception as e:
+                # Event capture must never break the compare flow
+                logger.warning(f"Mapping event batch write failed ({len(events)} events): {e}")
+
+
+# Process-wide writer (started/stopped by the app lifecycle)
+_EVENT_WRITER: Optional[MappingEventWriter] = None
+
+
+def start_event_writer() -> MappingEventWriter:
+    """Create (if needed) and start the process-wide mapping event writer."""
+    global _EVENT_WRITER
+    if _EVENT_WRITER is None:
+        _EVENT_WRITER = MappingEventWriter()
+    _EVENT_WRITER.start()
+    return _EVENT_WRITER
+
+
+async def stop_event_writer() -> None:
+    """Flush and stop the process-wide mapping event writer."""
+    global _EVENT_WRITER
+    if _EVENT_WRITER is not None:
+        await _EVENT_WRITER.stop()
+        _EVENT_WRITER = None
 
 
 async def maybe_create_unmapped_event(
@@ -25,8 +157,13 @@ async def maybe_create_unmapped_event(
     Constitutional: Only create events for UNMAPPED or AMBIGUOUS status.
     This function is called from compare endpoints when such status is detected.
 
+    When the background MappingEventWriter is running, the event is queued for
+    a batched write to db_pool and no event id is returned: the call returns
+    None without waiting for the write.
+
     Returns:
-        event_id (str) if event created/updated, None otherwise
+        event_id (str) only when no writer is running (synchronous write);
+        None when the event was queued or the status is not UNMAPPED/AMBIGUOUS
     """
     # Only create events for UNMAPPED or AMBIGUOUS
     if mapping_status not in ["UNMAPPED", "AMBIGUOUS"]:
@@ -37,9 +174,7 @@ async def maybe_create_unmapped_event(
         else DetectedStatus.AMBIGUOUS
     )
 
-    service = AdminMappingService(db_pool)
-
-    request = CreateMappingEventRequest(
+    request = MappingEventData(
         insurer=insurer,
         query_text=query_text,
         normalized_query=normalized_query,
@@ -49,6 +184,11 @@ async def maybe_create_unmapped_event(
         evidence_ref_ids=evidence_ref_ids,
     )
 
+    if _EVENT_WRITER is not None and _EVENT_WRITER.running:
+        _EVENT_WRITER.enqueue(db_pool, request)
+        return None
+
+    service = AdminMappingService(db_pool)
     event_id = await service.create_or_update_event(request)
     return str(event_id)
 
@@ -69,7 +209,8 @@ async def maybe_create_unmapped_event_from_compare(
         coverage_data: Coverage data from proposal_coverage_mapped (dict with keys: mapping_status, coverage_name_raw, etc.)
 
     Returns:
-        event_id if created, None otherwise
+        event_id if created synchronously; None if the event was queued for the
+        background writer (no id is returned then) or no event applies
     """
     mapping_status = coverage_data.get("mapping_status")
     if mapping_status not in ["UNMAPPED", "AMBIGUOUS"]:
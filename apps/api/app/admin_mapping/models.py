@@ -3,6 +3,7 @@ Admin Mapping Workbench - Data Models
 Constitutional: Canonical Coverage Rule - all coverage_code references must be 신정원 통일코드
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
@@ -62,6 +63,25 @@ class CreateMappingEventRequest(BaseModel):
     evidence_ref_ids: Optional[List[str]] = None
 
 
+# ============================================================================
+# Internal DTOs (server-side construction only, no validation)
+# ============================================================================
+
+@dataclass(slots=True, frozen=True)
+class MappingEventData:
+    """Mapping event payload built by the compare/clarify flow
+    Same fields as CreateMappingEventRequest; inputs are already trusted,
+    so pydantic validation is skipped on this path.
+    """
+    insurer: str
+    query_text: str
+    raw_coverage_title: str
+    detected_status: DetectedStatus
+    normalized_query: Optional[str] = None
+    candidate_coverage_codes: Optional[List[str]] = None
+    evidence_ref_ids: Optional[List[str]] = None
+
+
 class ApproveEventRequest(BaseModel):
     """Request to approve a mapping event
     Constitutional: coverage_code must be 신정원 통일코드 (canonical)
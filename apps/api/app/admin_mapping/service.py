@@ -5,12 +5,13 @@ Constitutional: Canonical Coverage Rule + Deterministic & Auditable
 
 import asyncpg
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
 from uuid import UUID
 import json
 
 from .models import (
     CreateMappingEventRequest,
+    MappingEventData,
     ApproveEventRequest,
     RejectEventRequest,
     SnoozeEventRequest,
@@ -20,6 +21,7 @@ from .models import (
     ApprovalResult,
     EventState,
     DetectedStatus,
+    ResolutionType,
     AuditAction,
     TargetType,
 )
@@ -49,7 +51,7 @@ class AdminMappingService:
     # ========================================================================
 
     async def create_or_update_event(
-        self, request: CreateMappingEventRequest
+        self, request: Union[CreateMappingEventRequest, MappingEventData]
     ) -> UUID:
         """
         Create new mapping event or update existing OPEN event.
@@ -120,6 +122,130 @@ class AdminMappingService:
                 )
                 return row["id"]
 
+    async def create_or_update_events(
+        self,
+        requests: List[Union[CreateMappingEventRequest, MappingEventData]],
+        conn: Optional[asyncpg.Connection] = None,
+    ) -> List[UUID]:
+        """
+        Batched create_or_update_event for many events on one connection.
+        Constitutional: Same deduplication as create_or_update_event - events sharing
+        (insurer, raw_coverage_title, detected_status) collapse to one OPEN event
+        (last request in the batch wins, as with sequential calls).
+
+        Pass `conn` to reuse an already-acquired connection (e.g. a batch writer);
+        otherwise one connection is acquired from the pool for the whole batch.
+
+        Returns event ids in first-seen key order.
+        """
+        latest = {}
+        for request in requests:
+            key = (request.insurer, request.raw_coverage_title, request.detected_status.value)
+            latest[key] = request
+
+        if not latest:
+            return []
+
+        if conn is None:
+            async with self.db_pool.acquire() as conn:
+                return await self.create_or_update_events(requests, conn=conn)
+
+        keys = list(latest)
+
+        async with conn.transaction():
+            # Check for existing OPEN events (single round-trip)
+            existing_rows = await conn.fetch(
+                """
+                SELECT q.id, q.insurer, q.raw_coverage_title, q.detected_status
+                FROM mapping_event_queue q
+                JOIN unnest($1::text[], $2::text[], $3::text[])
+                    AS k(insurer, raw_coverage_title, detected_status)
+                  USING (insurer, raw_coverage_title, detected_status)
+                WHERE q.state = 'OPEN'
+                """,
+                [k[0] for k in keys],
+                [k[1] for k in keys],
+                [k[2] for k in keys],
+            )
+            event_ids = {
+                (row["insurer"], row["raw_coverage_title"], row["detected_status"]): row["id"]
+                for row in existing_rows
+            }
+
+            update_args = []
+            new_keys = []
+            for key in keys:
+                request = latest[key]
+                candidate_codes_json = (
+                    json.dumps(request.candidate_coverage_codes)
+                    if request.candidate_coverage_codes
+                    else None
+                )
+                evidence_json = (
+                    json.dumps(request.evidence_ref_ids)
+                    if request.evidence_ref_ids
+                    else None
+                )
+                if key in event_ids:
+                    update_args.append((
+                        request.query_text,
+                        request.normalized_query,
+                        candidate_codes_json,
+                        evidence_json,
+                        event_ids[key],
+                    ))
+                else:
+                    new_keys.append((key, candidate_codes_json, evidence_json))
+
+            if update_args:
+                # Update existing events
+                await conn.executemany(
+                    """
+                    UPDATE mapping_event_queue
+                    SET query_text = $1,
+                        normalized_query = $2,
+                        candidate_coverage_codes = $3,
+                        evidence_ref_ids = $4,
+                        updated_at = NOW()
+                    WHERE id = $5
+                    """,
+                    update_args,
+                )
+
+            if new_keys:
+                # Create new events (single multi-row INSERT)
+                inserted = await conn.fetch(
+                    """
+                    INSERT INTO mapping_event_queue (
+                        insurer, query_text, normalized_query, raw_coverage_title,
+                        detected_status, candidate_coverage_codes, evidence_ref_ids
+                    )
+                    SELECT
+                        insurer, query_text, normalized_query, raw_coverage_title,
+                        detected_status, candidate_coverage_codes::jsonb, evidence_ref_ids::jsonb
+                    FROM unnest(
+                        $1::text[], $2::text[], $3::text[], $4::text[],
+                        $5::text[], $6::text[], $7::text[]
+                    ) AS t(
+                        insurer, query_text, normalized_query, raw_coverage_title,
+                        detected_status, candidate_coverage_codes, evidence_ref_ids
+                    )
+                    RETURNING id, insurer, raw_coverage_title, detected_status
+                    """,
+                    [key[0] for key, _, _ in new_keys],
+                    [latest[key].query_text for key, _, _ in new_keys],
+                    [latest[key].normalized_query for key, _, _ in new_keys],
+                    [key[1] for key, _, _ in new_keys],
+                    [key[2] for key, _, _ in new_keys],
+                    [codes for _, codes, _ in new_keys],
+                    [evidence for _, _, evidence in new_keys],
+                )
+                for row in inserted:
+                    key = (row["insurer"], row["raw_coverage_title"], row["detected_status"])
+                    event_ids[key] = row["id"]
+
+        return [event_ids[key] for key in keys]
+
     async def get_queue(
         self,
         state: Optional[EventState] = None,
@@ -172,8 +298,9 @@ class AdminMappingService:
                 offset,
             )
 
+            # DB rows are already typed (asyncpg) → skip pydantic validation
             events = [
-                MappingEventSummary(
+                MappingEventSummary.model_construct(
                     id=row["id"],
                     created_at=row["created_at"],
                     updated_at=row["updated_at"],
@@ -207,7 +334,8 @@ class AdminMappingService:
             if not row:
                 return None
 
-            return MappingEventDetail(
+            # DB row is already typed (asyncpg) → skip pydantic validation
+            return MappingEventDetail.model_construct(
                 id=row["id"],
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
@@ -228,7 +356,11 @@ class AdminMappingService:
                 ),
                 state=EventState(row["state"]),
                 resolved_coverage_code=row["resolved_coverage_code"],
-                resolution_type=row["resolution_type"],
+                resolution_type=(
+                    ResolutionType(row["resolution_type"])
+                    if row["resolution_type"]
+                    else None
+                ),
                 resolution_note=row["resolution_note"],
                 resolved_at=row["resolved_at"],
                 resolved_by=row["resolved_by"],
@@ -622,8 +754,9 @@ class AdminMappingService:
                 limit,
             )
 
+            # DB rows are already typed (asyncpg) → skip pydantic validation
             return [
-                AuditLogEntry(
+                AuditLogEntry.model_construct(
                     id=row["id"],
                     created_at=row["created_at"],
                     actor=row["actor"],
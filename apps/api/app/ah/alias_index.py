@@ -8,12 +8,55 @@ Constitutional Principles:
 4. Cancer-related coverages have special expansion rules
 """
 
-import pandas as pd
-from typing import Dict, List, Set, Optional
-from collections import defaultdict
+import sys
+import pickle
+import logging
+import functools
+import openpyxl
+from typing import Dict, FrozenSet, Set, Optional, Tuple
 from pathlib import Path
 
 from .alias_normalizer import AliasNormalizer
+from .keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+# Snapshot format version (bump when the pickled layout changes)
+_SNAPSHOT_VERSION = 3
+
+# Source files whose changes invalidate a snapshot (normalization/index logic)
+_SNAPSHOT_SOURCES = (
+    Path(__file__),
+    Path(__file__).with_name('alias_normalizer.py'),
+)
+
+# Max number of distinct (query, guardrail) pairs kept per index
+_RESOLVE_CACHE_SIZE = 8192
+
+# Cancer domain code prefixes (str.startswith accepts a tuple)
+_CANCER_CODE_PREFIXES = ('A42', 'A52', 'A62', 'A96')
+
+# Cancer guardrail keywords (matched against the normalized query)
+_CANCER_QUERY_KEYWORDS = [
+    '암진단',
+    '암 진단',
+    '일반암',
+    '유사암',
+    '제자리암',
+    '경계성종양',
+    '기타피부암',
+    '갑상선암',
+]
+
+# Keywords are whitespace-collapsed at import time to match normalized queries
+_CANCER_KW_MATCHER = KeywordMatcher(kw.replace(' ', '') for kw in _CANCER_QUERY_KEYWORDS)
+
+
+def _cell_str(row: tuple, idx: int) -> str:
+    """Stripped string value of an Excel cell ('' for empty/missing cells)."""
+    value = row[idx] if idx < len(row) else None
+    return str(value).strip() if value is not None else ''
 
 
 class AliasIndex:
@@ -27,10 +70,15 @@ class AliasIndex:
     """
 
     def __init__(self):
-        self.index: Dict[str, Set[str]] = defaultdict(set)
+        # Values are frozen, pre-sorted tuples after load (shared without copying)
+        self.index: Dict[str, Tuple[str, ...]] = {}
         self.canonical_to_display: Dict[str, str] = {}
-        self.cancer_canonical_codes: Set[str] = set()
+        self.cancer_canonical_codes: FrozenSet[str] = frozenset()
         self._loaded = False
+        # Per-instance resolve cache (cleared whenever the index is (re)loaded)
+        self._resolve_cached = functools.lru_cache(maxsize=_RESOLVE_CACHE_SIZE)(
+            self._resolve_uncached
+        )
 
     def load_from_excel(self, excel_path: Path) -> None:
         """
@@ -43,41 +91,75 @@ class AliasIndex:
         - 신정원코드명: canonical display name
         - 담보명(가입설계서): raw coverage name (alias)
         """
-        df = pd.read_excel(excel_path)
-
-        # Validate required columns
-        required_cols = ['cre_cvr_cd', '신정원코드명', '담보명(가입설계서)']
-        missing = [col for col in required_cols if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns in Excel: {missing}")
-
-        # Build index
-        for _, row in df.iterrows():
-            canonical_code = str(row['cre_cvr_cd']).strip()
-            canonical_display = str(row['신정원코드명']).strip()
-            raw_alias = str(row['담보명(가입설계서)']).strip()
-
-            if not canonical_code or canonical_code == 'nan':
-                continue
-
-            # Normalize alias
-            normalized_alias = AliasNormalizer.normalize(raw_alias)
-
+        # Stream rows in read-only mode (no DataFrame, only 3 columns kept)
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            header = [
+                str(cell).strip() if cell is not None else ''
+                for cell in next(rows, ())
+            ]
+
+            # Validate required columns
+            required_cols = ['cre_cvr_cd', '신정원코드명', '담보명(가입설계서)']
+            missing = [col for col in required_cols if col not in header]
+            if missing:
+                raise ValueError(f"Missing required columns in Excel: {missing}")
+
+            code_idx, display_idx, raw_idx = (header.index(col) for col in required_cols)
+
+            codes = []
+            displays = []
+            raws = []
+            for row in rows:
+                canonical_code = _cell_str(row, code_idx)
+
+                if not canonical_code or canonical_code == 'nan':
+                    continue
+
+                codes.append(canonical_code)
+                displays.append(_cell_str(row, display_idx))
+                raws.append(_cell_str(row, raw_idx))
+        finally:
+            wb.close()
+
+        # Normalize all aliases in one pass (pure-CPU phase)
+        # (cells are already coerced to str → skip the public input guard)
+        normalize = AliasNormalizer._normalize_unchecked
+        normalized_aliases = [normalize(raw_alias) for raw_alias in raws]
+
+        # Intern keys/codes: duplicates share one object and dict lookups
+        # can short-circuit on identity
+        normalized_aliases = [sys.intern(alias) for alias in normalized_aliases]
+        codes = [sys.intern(code) for code in codes]
+
+        # Build index (mutable sets while loading, frozen at the end)
+        index: Dict[str, Set[str]] = {alias: set(c) for alias, c in self.index.items()}
+        cancer_canonical_codes: Set[str] = set(self.cancer_canonical_codes)
+        for canonical_code, canonical_display, normalized_alias in zip(
+            codes, displays, normalized_aliases
+        ):
             if not normalized_alias:
                 continue
 
             # Add to index
-            self.index[normalized_alias].add(canonical_code)
+            alias_codes = index.get(normalized_alias)
+            if alias_codes is None:
+                alias_codes = set()
+                index[normalized_alias] = alias_codes
+            alias_codes.add(canonical_code)
 
-            # Store canonical display name
-            if canonical_code not in self.canonical_to_display:
-                self.canonical_to_display[canonical_code] = canonical_display
+            # Store canonical display name (first occurrence wins)
+            self.canonical_to_display.setdefault(canonical_code, canonical_display)
 
             # Detect cancer-related canonical codes
             if self._is_cancer_code(canonical_code, canonical_display):
-                self.cancer_canonical_codes.add(canonical_code)
+                cancer_canonical_codes.add(canonical_code)
 
+        self.index = {alias: tuple(sorted(c)) for alias, c in index.items()}
+        self.cancer_canonical_codes = frozenset(cancer_canonical_codes)
         self._loaded = True
+        self._resolve_cached.cache_clear()
 
     def _is_cancer_code(self, code: str, display: str) -> bool:
         """
@@ -87,14 +169,9 @@ class AliasIndex:
         - Code contains 'A42' or 'A52' or 'A62' or 'A96' (cancer domains)
         - Display contains '암'
         """
-        cancer_code_prefixes = ['A42', 'A52', 'A62', 'A96']
-        if any(code.startswith(prefix) for prefix in cancer_code_prefixes):
-            return True
-        if '암' in display:
-            return True
-        return False
+        return code.startswith(_CANCER_CODE_PREFIXES) or '암' in display
 
-    def resolve_query(self, query: str, apply_cancer_guardrail: bool = True) -> List[str]:
+    def resolve_query(self, query: str, apply_cancer_guardrail: bool = True) -> Tuple[str, ...]:
         """
         Resolve query to canonical coverage codes.
 
@@ -103,31 +180,38 @@ class AliasIndex:
             apply_cancer_guardrail: If True, expand cancer queries to full cancer group
 
         Returns:
-            List of canonical coverage codes (may be empty if unmapped)
+            Sorted tuple of canonical coverage codes (may be empty if unmapped).
+            The tuple is shared (cached), so it is returned without copying.
 
         Logic:
         1. Normalize query
         2. Lookup in index
         3. If cancer query + guardrail enabled → expand to all cancer codes
-        4. Return deduplicated list
+        4. Return deduplicated, sorted codes
         """
         if not self._loaded:
             raise RuntimeError("AliasIndex not loaded. Call load_from_excel() first.")
 
+        return self._resolve_cached(query, apply_cancer_guardrail)
+
+    def _resolve_uncached(self, query: str, apply_cancer_guardrail: bool) -> Tuple[str, ...]:
+        """
+        Uncached resolution body for resolve_query().
+        """
         # Normalize query
-        normalized_query = AliasNormalizer.normalize(query)
+        normalized_query = sys.intern(AliasNormalizer.normalize(query))
 
         if not normalized_query:
-            return []
+            return ()
 
-        # Direct lookup
-        canonical_codes = set(self.index.get(normalized_query, set()))
+        # Direct lookup (pre-sorted at load time)
+        canonical_codes = self.index.get(normalized_query) or ()
 
-        # Cancer guardrail
+        # Cancer guardrail (only this path allocates and sorts)
         if apply_cancer_guardrail and self._is_cancer_query(query, normalized_query):
-            canonical_codes.update(self.cancer_canonical_codes)
+            return tuple(sorted(self.cancer_canonical_codes.union(canonical_codes)))
 
-        return sorted(canonical_codes)
+        return canonical_codes
 
     def _is_cancer_query(self, original_query: str, normalized_query: str) -> bool:
         """
@@ -136,22 +220,55 @@ class AliasIndex:
         Cancer guardrail triggers:
         - Query contains '암진단', '암 진단', '일반암', '유사암', etc.
         """
-        cancer_keywords = [
-            '암진단',
-            '암 진단',
-            '일반암',
-            '유사암',
-            '제자리암',
-            '경계성종양',
-            '기타피부암',
-            '갑상선암',
-        ]
+        return _CANCER_KW_MATCHER.search(normalized_query)
+
+    def save_snapshot(self, snapshot_path: Path) -> None:
+        """
+        Persist the built index (index, display names, cancer codes) as a pickle.
+        """
+        if not self._loaded:
+            raise RuntimeError("AliasIndex not loaded. Call load_from_excel() first.")
 
-        for keyword in cancer_keywords:
-            if keyword.replace(' ', '') in normalized_query:
-                return True
+        payload = (
+            _SNAPSHOT_VERSION,
+            self.index,
+            self.canonical_to_display,
+            self.cancer_canonical_codes,
+        )
+        snapshot_path.write_bytes(pickle.dumps(payload, protocol=5))
 
-        return False
+    def load_snapshot(self, snapshot_path: Path, excel_path: Path) -> bool:
+        """
+        Load a snapshot written by save_snapshot() if it is still fresh.
+
+        A snapshot is fresh when it is newer than the Excel file and the
+        normalization/index source files. Returns False (index untouched)
+        if the snapshot is missing, stale, or unreadable.
+        """
+        try:
+            snapshot_mtime = snapshot_path.stat().st_mtime
+            source_mtime = max(
+                path.stat().st_mtime for path in (excel_path, *_SNAPSHOT_SOURCES)
+            )
+            if snapshot_mtime < source_mtime:
+                return False
+
+            version, index, canonical_to_display, cancer_canonical_codes = pickle.loads(
+                snapshot_path.read_bytes()
+            )
+        except (OSError, pickle.UnpicklingError, ValueError, TypeError, EOFError):
+            return False
+
+        if version != _SNAPSHOT_VERSION:
+            return False
+
+        # Interning is not preserved by pickle
+        self.index = {sys.intern(alias): codes for alias, codes in index.items()}
+        self.canonical_to_display = canonical_to_display
+        self.cancer_canonical_codes = frozenset(cancer_canonical_codes)
+        self._loaded = True
+        self._resolve_cached.cache_clear()
+        return True
 
     def get_display_name(self, canonical_code: str) -> Optional[str]:
         """
@@ -178,12 +295,13 @@ def get_alias_index() -> AliasIndex:
     """
     Get global singleton AliasIndex instance.
 
-    Lazy-loads from Excel on first access.
+    Lazy-loads on first access: from a fresh pickle snapshot next to the
+    Excel file if available, otherwise from Excel (then writes the snapshot).
     """
     global _GLOBAL_ALIAS_INDEX
 
     if _GLOBAL_ALIAS_INDEX is None:
-        _GLOBAL_ALIAS_INDEX = AliasIndex()
+        alias_index = AliasIndex()
 
         # Default Excel path
         excel_path = Path(__file__).parent.parent.parent.parent.parent / "data" / "담보명mapping자료.xlsx"
@@ -191,6 +309,15 @@ def get_alias_index() -> AliasIndex:
         if not excel_path.exists():
             raise FileNotFoundError(f"Excel mapping file not found: {excel_path}")
 
-        _GLOBAL_ALIAS_INDEX.load_from_excel(excel_path)
+        snapshot_path = excel_path.with_suffix('.pkl')
+        if not alias_index.load_snapshot(snapshot_path, excel_path):
+            alias_index.load_from_excel(excel_path)
+            try:
+                alias_index.save_snapshot(snapshot_path)
+            except OSError as e:
+                # Snapshot is an optimization only (e.g. read-only data dir)
+                logger.warning(f"AliasIndex snapshot write failed: {e}")
+
+        _GLOBAL_ALIAS_INDEX = alias_index
 
     return _GLOBAL_ALIAS_INDEX
@@ -13,6 +13,36 @@ Constitutional Rules (Non-Negotiable):
 import re
 from typing import Dict, Any
 
+try:
+    # Optional C-implemented scanner (re-compatible API/semantics for these patterns)
+    import regex as _strip_engine
+    REGEX_AVAILABLE = True
+except ImportError:
+    _strip_engine = re
+    REGEX_AVAILABLE = False
+
+
+# Single-pass strip pattern for the normalization hot path
+# (index build runs normalize() once per Excel row).
+# Alternation order mirrors the original sequential passes.
+_STRIP_RE = _strip_engine.compile(
+    r'\([^)]*\)'     # parentheses and their contents
+    r'|\[[^\]]*\]'  # brackets and their contents
+    r'|[ⅠⅡⅢⅣⅤ]+'    # Roman numerals (VERSION_PATTERNS)
+    r'|\d+대'        # N대 (VERSION_PATTERNS)
+    r'|\s+'         # all whitespace (including no-break spaces)
+)
+
+# Cancer query aliases → canonical base form (keys whitespace-collapsed + lowercased)
+_CANCER_ALIAS_MAP = {
+    alias.replace(' ', '').lower(): canonical_form
+    for alias, canonical_form in {
+        "일반암진단비": "암진단비",
+        "암진단": "암진단비",
+        "암진단금": "암진단비",
+    }.items()
+}
+
 
 class AliasNormalizer:
     """
@@ -45,6 +75,8 @@ class AliasNormalizer:
         r'\d+대',  # N대 (5대고액, 10대고액 etc.)
     ]
 
+    _CONDITIONAL_RES = [re.compile(p) for p in CONDITIONAL_PATTERNS]
+
     @staticmethod
     def normalize(text: str) -> str:
         """
@@ -55,26 +87,27 @@ class AliasNormalizer:
         if not text or not isinstance(text, str):
             return ""
 
-        # 1. Strip leading/trailing whitespace
-        result = text.strip()
-
-        # 2. Remove all parentheses and their contents
-        # (We extract conditionals first if needed, but for match key we remove all)
-        result = re.sub(r'\([^)]*\)', '', result)
-        result = re.sub(r'\[[^\]]*\]', '', result)
+        return AliasNormalizer._normalize_unchecked(text)
 
-        # 3. Remove version markers (Roman numerals, N대)
-        for pattern in AliasNormalizer.VERSION_PATTERNS:
-            result = re.sub(pattern, '', result)
+    @staticmethod
+    def _normalize_unchecked(text: str) -> str:
+        """
+        normalize() without the input guard.
 
-        # 4. Collapse all whitespace (including no-break spaces)
-        result = re.sub(r'\s+', '', result)
+        Caller guarantees `text` is a str (empty str is fine → "").
+        Used on the index build path where cells are already coerced to str.
+        """
+        # 1. Remove parentheses/brackets and their contents,
+        #    version markers (Roman numerals, N대) and all whitespace
+        #    in a single regex pass
+        # (We extract conditionals first if needed, but for match key we remove all)
+        result = _STRIP_RE.sub('', text)
 
-        # 5. Convert to lowercase for case-insensitive matching
+        # 2. Convert to lowercase for case-insensitive matching
         # (Korean doesn't have case, but some Latin chars might appear)
         result = result.lower()
 
-        # 6. Remove common suffixes (담보, 비, 금)
+        # 3. Remove common suffixes (담보, 비, 금)
         # Only if they are truly suffix (avoid removing from middle)
         # For now, we keep them to avoid over-normalization
 
@@ -107,16 +140,16 @@ class AliasNormalizer:
         conditionals = []
 
         # Extract conditionals before removal
-        for pattern in AliasNormalizer.CONDITIONAL_PATTERNS:
-            matches = re.findall(pattern, original)
+        for pattern in AliasNormalizer._CONDITIONAL_RES:
+            matches = pattern.findall(original)
             conditionals.extend(matches)
 
         # Determine flags
         has_exclusion = any('제외' in c for c in conditionals)
         has_payout_rate = any('%' in c for c in conditionals)
 
-        # Generate match key
-        match_key = AliasNormalizer.normalize(original)
+        # Generate match key (original is already a str)
+        match_key = AliasNormalizer._normalize_unchecked(original)
 
         return {
             "match_key": match_key,
@@ -137,15 +170,5 @@ class AliasNormalizer:
         """
         normalized = AliasNormalizer.normalize(query)
 
-        # Cancer-specific aliases
-        cancer_aliases = {
-            "일반암진단비": "암진단비",
-            "암진단": "암진단비",
-            "암진단금": "암진단비",
-        }
-
-        for alias, canonical_form in cancer_aliases.items():
-            if normalized == alias.replace(' ', '').lower():
-                return canonical_form
-
-        return normalized
+        # Cancer-specific aliases (keys pre-normalized at import time)
+        return _CANCER_ALIAS_MAP.get(normalized, normalized)
@@ -10,9 +10,10 @@ Principle:
 - Policy (약관) determines the canonical code, NOT proposal documents.
 """
 
-from enum import Enum
-from typing import Set, Dict, Optional, List, Any
-from dataclasses import dataclass, field
+from enum import Enum, IntFlag
+from functools import lru_cache
+from typing import Set, Dict, Optional, List, Any, Iterable, Tuple
+from dataclasses import dataclass
 
 
 class CancerCanonicalCode(str, Enum):
@@ -35,13 +36,69 @@ class CancerCanonicalCode(str, Enum):
     BORDERLINE = "CA_DIAG_BORDERLINE"
 
 
-@dataclass
+class ScopeMask(IntFlag):
+    """
+    Bitmask encoding of a set of CancerCanonicalCode values.
+
+    Set operations on scopes become integer ops (&, |, bit_count()).
+    """
+
+    GENERAL = 1
+    SIMILAR = 2
+    IN_SITU = 4
+    BORDERLINE = 8
+
+
+# CancerCanonicalCode ↔ ScopeMask bit (declaration order = iteration order)
+_CODE_TO_SCOPE_BIT: Dict[CancerCanonicalCode, ScopeMask] = {
+    CancerCanonicalCode.GENERAL: ScopeMask.GENERAL,
+    CancerCanonicalCode.SIMILAR: ScopeMask.SIMILAR,
+    CancerCanonicalCode.IN_SITU: ScopeMask.IN_SITU,
+    CancerCanonicalCode.BORDERLINE: ScopeMask.BORDERLINE,
+}
+
+
+def scope_mask_from_codes(codes: Iterable[CancerCanonicalCode]) -> int:
+    """
+    Encode canonical codes as a ScopeMask integer.
+    """
+    mask = 0
+    for code in codes:
+        mask |= _CODE_TO_SCOPE_BIT[code]
+    return int(mask)
+
+
+def codes_from_scope_mask(mask: int) -> Set[CancerCanonicalCode]:
+    """
+    Decode a ScopeMask integer into canonical codes.
+    """
+    return {code for code, bit in _CODE_TO_SCOPE_BIT.items() if mask & bit}
+
+
+# ScopeMask (0..15) → serialized code values, in bit order (shared tuples)
+_SCOPE_MASK_VALUES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(code.value for code, bit in _CODE_TO_SCOPE_BIT.items() if mask & bit)
+    for mask in range(1 << len(_CODE_TO_SCOPE_BIT))
+)
+
+
+def scope_mask_values(mask: int) -> Tuple[str, ...]:
+    """
+    Canonical code values of a ScopeMask integer, in bit order (deterministic).
+
+    Returns a shared precomputed tuple (no allocation per call).
+    """
+    return _SCOPE_MASK_VALUES[mask]
+
+
+@dataclass(slots=True, frozen=True)
 class NameBasedHint:
     """
     Hint extracted from coverage name (NOT a final decision).
 
     This is for debug/audit purposes only.
     DO NOT use this for canonical code determination.
+    Immutable: hints are cached per coverage name and shared.
     """
     mentions_in_situ: bool = False
     mentions_borderline: bool = False
@@ -51,7 +108,7 @@ class NameBasedHint:
     raw_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CancerScopeEvidence:
     """
     Evidence-based cancer coverage scope determination.
@@ -76,7 +133,7 @@ class CancerScopeEvidence:
     includes_in_situ: bool
     includes_borderline: bool
 
-    evidence_spans: Optional[List[Dict[str, Any]]] = field(default=None)  # [{doc_id, page, span_text, rule_id}]
+    evidence_spans: Optional[List[Dict[str, Any]]] = None  # [{doc_id, page, span_text, rule_id}]
     confidence: str = "unknown"  # evidence_strong | evidence_weak | unknown
     hint: Optional[NameBasedHint] = None
 
@@ -86,14 +143,23 @@ class CancerScopeEvidence:
 
         If confidence="unknown" → all includes_* must be False.
         """
-        if self.confidence == "unknown":
-            if any([self.includes_general, self.includes_similar,
-                   self.includes_in_situ, self.includes_borderline]):
-                raise ValueError(
-                    "AH-3 Constitutional violation: "
-                    "confidence='unknown' cannot have includes_*=True. "
-                    "Evidence required for scope determination."
-                )
+        if self.confidence == "unknown" and self._scope_mask():
+            raise ValueError(
+                "AH-3 Constitutional violation: "
+                "confidence='unknown' cannot have includes_*=True. "
+                "Evidence required for scope determination."
+            )
+
+    def _scope_mask(self) -> int:
+        """
+        includes_* flags as a ScopeMask integer (GENERAL=1, SIMILAR=2, IN_SITU=4, BORDERLINE=8).
+        """
+        return (
+            bool(self.includes_general)
+            | bool(self.includes_similar) << 1
+            | bool(self.includes_in_situ) << 2
+            | bool(self.includes_borderline) << 3
+        )
 
     def get_canonical_code(self) -> Optional[CancerCanonicalCode]:
         """
@@ -110,20 +176,21 @@ class CancerScopeEvidence:
         Returns:
             CancerCanonicalCode if unambiguous, None if ambiguous/unknown
         """
-        includes = [
-            (self.includes_general, CancerCanonicalCode.GENERAL),
-            (self.includes_similar, CancerCanonicalCode.SIMILAR),
-            (self.includes_in_situ, CancerCanonicalCode.IN_SITU),
-            (self.includes_borderline, CancerCanonicalCode.BORDERLINE),
-        ]
+        # Single-bit masks only; multiple (ambiguous) or none (unknown) → None
+        return _SCOPE_MASK_TO_CODE.get(self._scope_mask())
 
-        matched = [code for included, code in includes if included]
 
-        if len(matched) == 1:
-            return matched[0]
-        else:
-            # Ambiguous (multiple) or unknown (none)
-            return None
+# Single-scope bitmask → canonical code (see CancerScopeEvidence._scope_mask)
+_SCOPE_MASK_TO_CODE: Dict[int, CancerCanonicalCode] = {
+    int(bit): code for code, bit in _CODE_TO_SCOPE_BIT.items()
+}
+
+
+def single_code_from_scope_mask(mask: int) -> Optional[CancerCanonicalCode]:
+    """
+    The canonical code of a single-bit ScopeMask (None if 0 or several bits).
+    """
+    return _SCOPE_MASK_TO_CODE.get(mask)
 
 
 # Constitutional mapping: Legacy code → New canonical code
@@ -159,15 +226,50 @@ def get_canonical_display_name(code: CancerCanonicalCode) -> str:
     return CANONICAL_DISPLAY_NAMES.get(code, str(code))
 
 
+# Valid canonical code values (membership test without Enum lookup/exception)
+_CANONICAL_VALUES: frozenset = frozenset(c.value for c in CancerCanonicalCode)
+
+
 def is_cancer_canonical_code(code: str) -> bool:
     """
     Check if code is a valid cancer canonical code.
     """
-    try:
-        CancerCanonicalCode(code)
-        return True
-    except ValueError:
-        return False
+    return code in _CANONICAL_VALUES
+
+
+# Coverage-name keyword bits (spaces removed; Hangul keywords → no case folding)
+# Shared by the heuristic split and NameBasedHint extraction.
+NAME_KW_SIMILAR = 1 << 0           # "유사암"
+NAME_KW_IN_SITU = 1 << 1           # "제자리암"
+NAME_KW_BORDERLINE = 1 << 2        # "경계성" (also covers "경계성종양")
+NAME_KW_GENERAL = 1 << 3           # "암진단" / "일반암"
+NAME_KW_SIMILAR_EXCLUDED = 1 << 4  # "유사암제외" (also covers "4대유사암제외")
+
+_NAME_KEYWORD_BITS = (
+    ("유사암", NAME_KW_SIMILAR),
+    ("제자리암", NAME_KW_IN_SITU),
+    ("경계성", NAME_KW_BORDERLINE),
+    ("암진단", NAME_KW_GENERAL),
+    ("일반암", NAME_KW_GENERAL),
+    ("유사암제외", NAME_KW_SIMILAR_EXCLUDED),
+)
+
+
+@lru_cache(maxsize=4096)
+def coverage_name_keyword_mask(coverage_name_raw: str) -> int:
+    """
+    Bitmask of cancer scope keywords mentioned in a coverage name.
+
+    Computed once per distinct name (coverage names repeat across insurers
+    and rows). Short names → plain substring checks are cheaper than an
+    automaton pass here.
+    """
+    name_compact = coverage_name_raw.replace(" ", "")
+    mask = 0
+    for keyword, bit in _NAME_KEYWORD_BITS:
+        if keyword in name_compact:
+            mask |= bit
+    return mask
 
 
 def split_cancer_coverage_by_scope(
@@ -205,27 +307,27 @@ def split_cancer_coverage_by_scope(
     # This is NOT constitutional, only for unmapped cases
     codes: Set[CancerCanonicalCode] = set()
 
-    name_lower = coverage_name_raw.lower().replace(" ", "")
+    mask = coverage_name_keyword_mask(coverage_name_raw)
 
     # Detect "유사암" explicitly
-    if "유사암" in name_lower:
+    if mask & NAME_KW_SIMILAR:
         codes.add(CancerCanonicalCode.SIMILAR)
 
     # Detect "제자리암"
-    if "제자리암" in name_lower:
+    if mask & NAME_KW_IN_SITU:
         codes.add(CancerCanonicalCode.IN_SITU)
 
     # Detect "경계성종양"
-    if "경계성종양" in name_lower or "경계성" in name_lower:
+    if mask & NAME_KW_BORDERLINE:
         codes.add(CancerCanonicalCode.BORDERLINE)
 
     # Detect general cancer (암진단 but not 유사암/제자리암/경계성종양)
-    if "암진단" in name_lower or "일반암" in name_lower:
+    if mask & NAME_KW_GENERAL:
         if not codes:  # Only if no specific type detected
             codes.add(CancerCanonicalCode.GENERAL)
 
     # If exclusion clause present, remove SIMILAR
-    if "유사암제외" in name_lower or "유사암 제외" in name_lower:
+    if mask & NAME_KW_SIMILAR_EXCLUDED:
         codes.discard(CancerCanonicalCode.SIMILAR)
         if not codes:  # If empty after removal, add GENERAL
             codes.add(CancerCanonicalCode.GENERAL)
@@ -11,10 +11,15 @@ This module provides clean data structures for compare pipeline integration.
 """
 
 from enum import Enum
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Tuple
 from dataclasses import dataclass, field
 
-from .cancer_canonical import CancerCanonicalCode
+from .cancer_canonical import (
+    CancerCanonicalCode,
+    codes_from_scope_mask,
+    scope_mask_from_codes,
+    scope_mask_values,
+)
 
 
 class DecisionStatus(str, Enum):
@@ -30,7 +35,7 @@ class DecisionStatus(str, Enum):
     UNDECIDED = "undecided"
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class CancerCanonicalDecision:
     """
     Cancer canonical decision result for compare pipeline.
@@ -44,20 +49,62 @@ class CancerCanonicalDecision:
     Fields:
     - coverage_name_raw: Original coverage name from proposal
     - insurer_code: Insurer code
-    - recalled_candidates: Set of recalled canonical codes from alias
-    - decided_canonical_codes: Set of decided canonical codes (evidence-based)
+    - recalled_mask: ScopeMask of recalled canonical codes from alias
+    - decided_mask: ScopeMask of decided canonical codes (evidence-based)
     - decision_status: DECIDED | UNDECIDED
     - decision_evidence_spans: List of evidence spans (only for DECIDED)
     - decision_method: Method used for decision (policy_evidence | undecided)
+
+    recalled_candidates / decided_canonical_codes remain available (as
+    constructor arguments and properties) as Set[CancerCanonicalCode] views
+    over the masks.
     """
 
     coverage_name_raw: str
     insurer_code: str
-    recalled_candidates: Set[CancerCanonicalCode] = field(default_factory=set)
-    decided_canonical_codes: Set[CancerCanonicalCode] = field(default_factory=set)
-    decision_status: DecisionStatus = DecisionStatus.UNDECIDED
-    decision_evidence_spans: Optional[List[Dict[str, Any]]] = None
-    decision_method: str = "undecided"  # policy_evidence | undecided
+    recalled_mask: int
+    decided_mask: int
+    decision_status: DecisionStatus
+    decision_evidence_spans: Optional[List[Dict[str, Any]]]
+    decision_method: str  # policy_evidence | undecided
+
+    def __init__(
+        self,
+        coverage_name_raw: str,
+        insurer_code: str,
+        recalled_candidates: Optional[Set[CancerCanonicalCode]] = None,
+        decided_canonical_codes: Optional[Set[CancerCanonicalCode]] = None,
+        decision_status: DecisionStatus = DecisionStatus.UNDECIDED,
+        decision_evidence_spans: Optional[List[Dict[str, Any]]] = None,
+        decision_method: str = "undecided",
+        recalled_mask: int = 0,
+        decided_mask: int = 0,
+    ):
+        self.coverage_name_raw = coverage_name_raw
+        self.insurer_code = insurer_code
+        self.recalled_mask = recalled_mask | scope_mask_from_codes(recalled_candidates or ())
+        self.decided_mask = decided_mask | scope_mask_from_codes(decided_canonical_codes or ())
+        self.decision_status = decision_status
+        self.decision_evidence_spans = decision_evidence_spans
+        self.decision_method = decision_method
+
+    @property
+    def recalled_candidates(self) -> Set[CancerCanonicalCode]:
+        """Recalled canonical codes (decoded from recalled_mask)."""
+        return codes_from_scope_mask(self.recalled_mask)
+
+    @recalled_candidates.setter
+    def recalled_candidates(self, codes: Set[CancerCanonicalCode]) -> None:
+        self.recalled_mask = scope_mask_from_codes(codes)
+
+    @property
+    def decided_canonical_codes(self) -> Set[CancerCanonicalCode]:
+        """Decided canonical codes (decoded from decided_mask)."""
+        return codes_from_scope_mask(self.decided_mask)
+
+    @decided_canonical_codes.setter
+    def decided_canonical_codes(self, codes: Set[CancerCanonicalCode]) -> None:
+        self.decided_mask = scope_mask_from_codes(codes)
 
     def is_decided(self) -> bool:
         """Check if decision is confirmed."""
@@ -75,27 +122,33 @@ class CancerCanonicalDecision:
         - If DECIDED: return decided_canonical_codes
         - If UNDECIDED: return empty set (do NOT use recalled_candidates for comparison)
         """
+        return codes_from_scope_mask(self.get_scope_mask_for_compare())
+
+    def get_scope_mask_for_compare(self) -> int:
+        """
+        ScopeMask variant of get_canonical_codes_for_compare() (0 if UNDECIDED).
+        """
         if self.is_decided():
-            return self.decided_canonical_codes
+            return self.decided_mask
         else:
             # UNDECIDED: do NOT use recalled_candidates for comparison
             # They are only for display/debug purposes
-            return set()
+            return 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
         return {
             "coverage_name_raw": self.coverage_name_raw,
             "insurer_code": self.insurer_code,
-            "recalled_candidates": [c.value for c in self.recalled_candidates],
-            "decided_canonical_codes": [c.value for c in self.decided_canonical_codes],
+            "recalled_candidates": list(scope_mask_values(self.recalled_mask)),
+            "decided_canonical_codes": list(scope_mask_values(self.decided_mask)),
             "decision_status": self.decision_status.value,
             "decision_evidence_spans": self.decision_evidence_spans or [],
             "decision_method": self.decision_method,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CancerCompareContext:
     """
     Cancer canonical decision context for compare request.
@@ -112,30 +165,53 @@ class CancerCompareContext:
     query: str
     decisions: List[CancerCanonicalDecision] = field(default_factory=list)
 
+    def _counts(self) -> Tuple[int, int]:
+        """(decided, undecided) counts in a single pass over decisions."""
+        decided = 0
+        undecided = 0
+        for d in self.decisions:
+            status = d.decision_status
+            if status == DecisionStatus.DECIDED:
+                decided += 1
+            elif status == DecisionStatus.UNDECIDED:
+                undecided += 1
+        return decided, undecided
+
     def get_decided_count(self) -> int:
         """Get count of decided decisions."""
-        return sum(1 for d in self.decisions if d.is_decided())
+        return self._counts()[0]
 
     def get_undecided_count(self) -> int:
         """Get count of undecided decisions."""
-        return sum(1 for d in self.decisions if d.is_undecided())
+        return self._counts()[1]
+
+    def get_scope_mask_for_compare(self) -> int:
+        """Union ScopeMask of all DECIDED decisions (0 if none decided)."""
+        mask = 0
+        for d in self.decisions:
+            mask |= d.get_scope_mask_for_compare()
+        return mask
 
     def get_decided_rate(self) -> float:
         """Get percentage of decided decisions."""
+        return self._decided_rate(self.get_decided_count())
+
+    def _decided_rate(self, decided_count: int) -> float:
         total = len(self.decisions)
         if total == 0:
             return 0.0
-        return self.get_decided_count() / total
+        return decided_count / total
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
+        decided_count, undecided_count = self._counts()
         return {
             "query": self.query,
             "decisions": [d.to_dict() for d in self.decisions],
             "stats": {
                 "total_decisions": len(self.decisions),
-                "decided_count": self.get_decided_count(),
-                "undecided_count": self.get_undecided_count(),
-                "decided_rate": self.get_decided_rate(),
+                "decided_count": decided_count,
+                "undecided_count": undecided_count,
+                "decided_rate": self._decided_rate(decided_count),
             },
         }
@@ -16,10 +16,13 @@ Evidence Type Impact on Canonical Split:
 """
 
 import re
+import functools
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+from .keyword_matcher import KeywordMatcher
+
 
 class CancerEvidenceType(str, Enum):
     """
@@ -38,10 +41,10 @@ class CancerEvidenceType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvidenceTypeResult:
     """
-    Result of evidence typing.
+    Result of evidence typing (immutable: results are cached and shared).
 
     Fields:
     - evidence_type: CancerEvidenceType
@@ -95,6 +98,7 @@ class CancerEvidenceTyper:
     ]
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def classify_evidence(policy_text: str) -> EvidenceTypeResult:
         """
         Classify evidence type from policy text.
@@ -110,42 +114,47 @@ class CancerEvidenceTyper:
         2. Check for EXCLUSION patterns
         3. Check for DEFINITION_INCLUDED patterns
         4. Default to UNKNOWN
+
+        Within a category, the first pattern in declaration order wins.
+
+        Results are cached per text (policy spans repeat across documents);
+        result instances are prebuilt per rule and shared (frozen).
         """
-        text_lower = policy_text.lower().replace(" ", "")
-
-        # Priority 1: Separate benefit (most specific)
-        for pattern, label in CancerEvidenceTyper.SEPARATE_BENEFIT_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EvidenceTypeResult(
-                    evidence_type=CancerEvidenceType.SEPARATE_BENEFIT,
-                    confidence=0.9,
-                    matched_pattern=label,
-                )
-
-        # Priority 2: Exclusion
-        for pattern, label in CancerEvidenceTyper.EXCLUSION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EvidenceTypeResult(
-                    evidence_type=CancerEvidenceType.EXCLUSION,
-                    confidence=0.9,
-                    matched_pattern=label,
-                )
-
-        # Priority 3: Definition/Inclusion
-        for pattern, label in CancerEvidenceTyper.DEFINITION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EvidenceTypeResult(
-                    evidence_type=CancerEvidenceType.DEFINITION_INCLUDED,
-                    confidence=0.8,
-                    matched_pattern=label,
-                )
+        # Patterns are Hangul-only → no lower() copy
+        text_compact = policy_text.replace(" ", "")
+
+        if _RESIDUAL_WS_RE.search(text_compact) is None:
+            # Fast path: no whitespace left → every \s* gap is empty, so each
+            # pattern is its compact literal keyword (single keyword matcher).
+            keyword = _KEYWORD_MATCHER.first(text_compact)
+            if keyword is not None:
+                return _KEYWORD_RULES[keyword]
+        else:
+            # Newlines/tabs remain → regex path (\s* may span them)
+            match = _PRIORITY_RE.match(text_compact)
+            if match is not None:
+                return _PRIORITY_RULES[match.lastgroup]
 
         # Default: Unknown
-        return EvidenceTypeResult(
-            evidence_type=CancerEvidenceType.UNKNOWN,
-            confidence=0.0,
-            matched_pattern=None,
-        )
+        return _UNKNOWN_RESULT
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def classify_many(policy_texts: Tuple[str, ...]) -> Tuple[EvidenceTypeResult, ...]:
+        """
+        Classify a batch of policy texts (same results as classify_evidence per text).
+
+        Args:
+            policy_texts: Tuple of policy span texts (hashable → cacheable)
+
+        Returns:
+            Tuple of EvidenceTypeResult, aligned with policy_texts
+
+        The whole batch is cached: the same document's spans are re-typed for
+        every compare query, so a repeated batch costs one lookup.
+        """
+        classify = CancerEvidenceTyper.classify_evidence
+        return tuple(classify(text) for text in policy_texts)
 
     @staticmethod
     def enrich_evidence_span(
@@ -163,12 +172,72 @@ class CancerEvidenceTyper:
         """
         type_result = CancerEvidenceTyper.classify_evidence(policy_text)
 
-        enriched = span.copy()
-        enriched["evidence_type"] = type_result.evidence_type.value
-        enriched["type_confidence"] = type_result.confidence
-        enriched["type_matched_pattern"] = type_result.matched_pattern
+        return {
+            **span,
+            "evidence_type": type_result.evidence_type.value,
+            "type_confidence": type_result.confidence,
+            "type_matched_pattern": type_result.matched_pattern,
+        }
 
-        return enriched
+
+# Shared result for spans without any evidence pattern
+_UNKNOWN_RESULT = EvidenceTypeResult(
+    evidence_type=CancerEvidenceType.UNKNOWN,
+    confidence=0.0,
+    matched_pattern=None,
+)
+
+# Category order = classification priority (SEPARATE_BENEFIT > EXCLUSION > DEFINITION)
+_CATEGORY_RULES = [
+    (CancerEvidenceType.SEPARATE_BENEFIT, 0.9, CancerEvidenceTyper.SEPARATE_BENEFIT_PATTERNS),
+    (CancerEvidenceType.EXCLUSION, 0.9, CancerEvidenceTyper.EXCLUSION_PATTERNS),
+    (CancerEvidenceType.DEFINITION_INCLUDED, 0.8, CancerEvidenceTyper.DEFINITION_PATTERNS),
+]
+
+
+def _build_keyword_rules() -> Dict[str, EvidenceTypeResult]:
+    """
+    Compact keyword → prebuilt result, in classification priority order
+    (category priority, then declaration order).
+    """
+    rules: Dict[str, EvidenceTypeResult] = {}
+    for evidence_type, confidence, patterns in _CATEGORY_RULES:
+        for pattern, label in patterns:
+            rules.setdefault(
+                pattern.replace(r"\s*", ""),
+                EvidenceTypeResult(evidence_type, confidence, label),
+            )
+    return rules
+
+
+_KEYWORD_RULES = _build_keyword_rules()
+# Keyword order = priority order, so KeywordMatcher.first() picks the winner
+_KEYWORD_MATCHER = KeywordMatcher(_KEYWORD_RULES)
+
+
+def _build_priority_regex() -> Tuple["re.Pattern[str]", Dict[str, EvidenceTypeResult]]:
+    """
+    Fused priority regex + group name → prebuilt result.
+
+    Used for text that still contains whitespace after removing spaces.
+    One lookahead alternative per rule, in priority order: alternatives are
+    tried left to right and each scans the whole text, so the first rule
+    that matches anywhere wins — the same answer as searching the patterns
+    one by one (a plain alternation would return the leftmost hit instead).
+    """
+    rules: Dict[str, EvidenceTypeResult] = {}
+    alternatives = []
+    for evidence_type, confidence, patterns in _CATEGORY_RULES:
+        for pattern, label in patterns:
+            group = f"r{len(rules)}"
+            rules[group] = EvidenceTypeResult(evidence_type, confidence, label)
+            alternatives.append(f"(?=.*?(?P<{group}>{pattern}))")
+    return re.compile("(?s)" + "|".join(alternatives)), rules
+
+
+_PRIORITY_RE, _PRIORITY_RULES = _build_priority_regex()
+
+_RESIDUAL_WS_RE = re.compile(r"\s")
 
 
 def classify_policy_spans(
@@ -183,12 +252,15 @@ def classify_policy_spans(
     Returns:
         List of enriched spans with evidence_type
     """
-    typer = CancerEvidenceTyper()
-    enriched_spans = []
-
-    for span in policy_spans:
-        text = span.get("span_text") or span.get("text") or ""
-        enriched = typer.enrich_evidence_span(span, text)
-        enriched_spans.append(enriched)
-
-    return enriched_spans
+    results = CancerEvidenceTyper.classify_many(
+        tuple(span.get("span_text") or span.get("text") or "" for span in policy_spans)
+    )
+    return [
+        {
+            **span,
+            "evidence_type": result.evidence_type.value,
+            "type_confidence": result.confidence,
+            "type_matched_pattern": result.matched_pattern,
+        }
+        for span, result in zip(policy_spans, results)
+    ]
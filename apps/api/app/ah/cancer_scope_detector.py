@@ -10,14 +10,25 @@ This module detects cancer coverage scope from policy text using deterministic r
 """
 
 import re
-from typing import Optional, List, Dict, Any
+import functools
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from dataclasses import dataclass
 
-from .cancer_canonical import CancerScopeEvidence, NameBasedHint
-from .cancer_evidence_typer import CancerEvidenceType, CancerEvidenceTyper
-
-
-@dataclass
+from .cancer_canonical import (
+    CancerScopeEvidence,
+    NameBasedHint,
+    coverage_name_keyword_mask,
+    NAME_KW_SIMILAR,
+    NAME_KW_IN_SITU,
+    NAME_KW_BORDERLINE,
+    NAME_KW_GENERAL,
+    NAME_KW_SIMILAR_EXCLUDED,
+)
+from .cancer_evidence_typer import CancerEvidenceType, CancerEvidenceTyper, EvidenceTypeResult
+from .keyword_matcher import KeywordMaskMatcher
+
+
+@dataclass(slots=True)
 class PolicyTextSpan:
     """
     Policy text span for evidence.
@@ -29,6 +40,148 @@ class PolicyTextSpan:
     section: Optional[str] = None
 
 
+# Category bits of the scope keyword pass (+ gate bit for the C00~C97 range)
+_SCOPE_KW_GENERAL = 1
+_SCOPE_KW_SIMILAR = 2
+_SCOPE_KW_IN_SITU = 4
+_SCOPE_KW_BORDERLINE = 8
+_SCOPE_KW_GENERAL_RANGE = 16
+
+
+def _kcd_codes(letter: str, numbers: Iterable[int]) -> List[str]:
+    """KCD codes in both letter cases, e.g. ("D", range(10)) → D00, d00, ..., d09"""
+    return [f"{case}{n:02d}" for n in numbers for case in (letter.upper(), letter.lower())]
+
+
+def _build_scope_keyword_matcher() -> KeywordMaskMatcher:
+    """
+    Literal expansion of the CancerScopeDetector category patterns.
+
+    - GENERAL: 일반암 | 악성신생물 (+ C00 gate for [Cc]00\\s*[-~]\\s*[Cc]97)
+    - SIMILAR: 유사암 | 갑상선암 | 기타피부암 | [Cc]73 | [Cc]44
+    - IN_SITU: 제자리암 | 상피내암 | [Dd]0[0-9]
+    - BORDERLINE: 경계성종양 | [Dd][34][0-9]
+    """
+    keyword_bits: Dict[str, int] = {}
+
+    def add(keywords: List[str], bit: int) -> None:
+        for keyword in keywords:
+            keyword_bits[keyword] = keyword_bits.get(keyword, 0) | bit
+
+    add(["일반암", "악성신생물"], _SCOPE_KW_GENERAL)
+    add(_kcd_codes("C", (0,)), _SCOPE_KW_GENERAL_RANGE)
+    add(["유사암", "갑상선암", "기타피부암"] + _kcd_codes("C", (73, 44)), _SCOPE_KW_SIMILAR)
+    add(["제자리암", "상피내암"] + _kcd_codes("D", range(10)), _SCOPE_KW_IN_SITU)
+    add(["경계성종양"] + _kcd_codes("D", range(30, 50)), _SCOPE_KW_BORDERLINE)
+    return KeywordMaskMatcher(keyword_bits)
+
+
+_SCOPE_KEYWORD_MATCHER = _build_scope_keyword_matcher()
+
+# Every scope keyword contains one of these (Hangul keywords: 암 / 종양 / 악성,
+# KCD codes: C / D in either case). C-level substring checks reject spans
+# without any anchor (headers, article text, ...) before the keyword pass.
+_SCOPE_ANCHORS = ("암", "종양", "악성", "C", "c", "D", "d")
+
+
+def _has_scope_anchor(text: str) -> bool:
+    """True if text contains any scope anchor (False → no scope can match)."""
+    for anchor in _SCOPE_ANCHORS:
+        if anchor in text:
+            return True
+    return False
+
+
+# "은 제외" tail of the exclusion context rule (\s may span lines)
+_EUN_EXCLUDED_RE = re.compile(r"은\s*제외")
+
+
+def _on_same_line(text: str, first: str, second: str) -> bool:
+    """
+    Both keywords occur on one line.
+
+    Same result as re.search(rf"{first}.*{second}|{second}.*{first}", text)
+    for keywords without common characters ('.' stops at '\\n'), but linear:
+    the regex rescans the rest of the line after every keyword occurrence.
+    """
+    if first not in text or second not in text:
+        return False
+    if "\n" not in text:
+        return True
+    for line in text.split("\n"):
+        if first in line and second in line:
+            return True
+    return False
+
+
+def _excluded_after(text: str, keyword: str, line_keyword: str) -> bool:
+    """
+    "제외" context after a cancer type keyword.
+
+    Same result as re.search(rf"{keyword}[^\\)]*제외|{line_keyword}.*은\\s*제외", text),
+    but linear (no rescan after every keyword occurrence):
+    - keyword followed by "제외" with no ")" in between
+    - line_keyword followed on the same line by "은", whitespace, "제외"
+    """
+    if "제외" not in text:
+        return False
+
+    # keyword[^)]*제외 → first keyword of each ")"-delimited segment
+    for segment in text.split(")"):
+        start = segment.find(keyword)
+        if start >= 0 and segment.find("제외", start + len(keyword)) >= 0:
+            return True
+
+    # line_keyword.*은\s*제외 → leftmost "은 제외" after a keyword, same line
+    pos = 0
+    while True:
+        start = text.find(line_keyword, pos)
+        if start < 0:
+            return False
+        match = _EUN_EXCLUDED_RE.search(text, start + len(line_keyword))
+        if match is None:
+            return False
+        line_end = text.find("\n", start)
+        if line_end < 0 or match.start() < line_end:
+            return True
+        # No "은 제외" starts before the match line → resume on that line
+        pos = text.rfind("\n", 0, match.start()) + 1
+
+
+# (general, similar, in_situ, borderline, evidence type) of one policy text
+ScopeFlags = Tuple[bool, bool, bool, bool, Optional[EvidenceTypeResult]]
+
+_NO_SCOPE_FLAGS: ScopeFlags = (False, False, False, False, None)
+
+
+def _scope_evidence_span(
+    document_id: str, page: int, span_text: str, type_result: EvidenceTypeResult
+) -> Dict[str, Any]:
+    """Evidence span dict of one scope-matching policy chunk (AH-4: with evidence_type)."""
+    return {
+        "doc_id": document_id,
+        "doc_type": "policy",
+        "page": page,
+        "span_text": span_text,
+        "rule_id": "cancer_scope_detector_v2_ah4",
+        "evidence_type": type_result.evidence_type.value,
+        "type_confidence": type_result.confidence,
+        "type_matched_pattern": type_result.matched_pattern,
+    }
+
+
+def _no_scope_evidence() -> CancerScopeEvidence:
+    """Fresh 'no scope detected' evidence (instances are mutable)."""
+    return CancerScopeEvidence(
+        includes_general=False,
+        includes_similar=False,
+        includes_in_situ=False,
+        includes_borderline=False,
+        evidence_spans=None,
+        confidence="unknown",
+    )
+
+
 class CancerScopeDetector:
     """
     Deterministic cancer scope detector from policy text.
@@ -43,27 +196,26 @@ class CancerScopeDetector:
     GENERAL_CANCER_PATTERNS = [
         r"일반암",
         r"악성신생물",
-        r"C00\s*[-~]\s*C97",  # KCD-7 general cancer range
+        r"[Cc]00\s*[-~]\s*[Cc]97",  # KCD-7 general cancer range
     ]
 
     SIMILAR_CANCER_PATTERNS = [
         r"유사암",
         r"갑상선암",
         r"기타피부암",
-        r"C73",  # Thyroid
-        r"C44",  # Other skin cancer
+        r"[Cc]73",  # Thyroid
+        r"[Cc]44",  # Other skin cancer
     ]
 
     IN_SITU_PATTERNS = [
         r"제자리암",
         r"상피내암",
-        r"D0[0-9]",  # KCD-7 in-situ range
+        r"[Dd]0[0-9]",  # KCD-7 in-situ range
     ]
 
     BORDERLINE_PATTERNS = [
         r"경계성종양",
-        r"D3[0-9]",  # KCD-7 borderline range
-        r"D4[0-9]",
+        r"[Dd][34][0-9]",  # KCD-7 borderline range (D30-D49)
     ]
 
     EXCLUSION_PATTERNS = [
@@ -73,6 +225,14 @@ class CancerScopeDetector:
         r"대상이\s*아님",
     ]
 
+    # Category keywords are matched in one Aho–Corasick pass
+    # (_SCOPE_KEYWORD_MATCHER); only the C00~C97 range needs a regex
+    # (separator/whitespace variants), gated by a "C00" keyword hit
+    _GENERAL_RANGE_RE = re.compile(r"[Cc]00\s*[-~]\s*[Cc]97")
+
+    # "별도" / "제외" context rules are linear substring checks
+    # (_on_same_line / _excluded_after), see the rule comments below
+
     @staticmethod
     def detect_scope_from_text(
         policy_text: str, policy_span: PolicyTextSpan
@@ -88,34 +248,75 @@ class CancerScopeDetector:
             CancerScopeEvidence with scope flags
 
         Logic (Deterministic + Evidence Typing AH-4):
-        1. Classify evidence type (DEFINITION_INCLUDED / EXCLUSION / SEPARATE_BENEFIT)
-        2. Search for cancer type patterns
+        1. Search for cancer type patterns (none → unknown, no typing needed)
+        2. Classify evidence type (DEFINITION_INCLUDED / EXCLUSION / SEPARATE_BENEFIT)
         3. Apply evidence type rules:
            - DEFINITION_INCLUDED: Set parent scope only (e.g., SIMILAR), NOT sub-types
            - SEPARATE_BENEFIT: Allow sub-type scope (e.g., IN_SITU)
            - EXCLUSION: Disable specified scopes
         4. Conservative: if unclear → False (don't include)
         """
-        text_lower = policy_text.lower()
+        flags = CancerScopeDetector._detect_scope_flags(policy_text)
+        includes_general, includes_similar, includes_in_situ, includes_borderline, type_result = flags
 
-        # AH-4: Classify evidence type first
-        typer = CancerEvidenceTyper()
-        type_result = typer.classify_evidence(policy_text)
-        evidence_type = type_result.evidence_type
-
-        # Detect inclusions (initial broad detection)
-        includes_general = CancerScopeDetector._detect_pattern(
-            text_lower, CancerScopeDetector.GENERAL_CANCER_PATTERNS
+        # No scope left → unknown confidence, no evidence spans
+        has_any_match = (
+            includes_general or includes_similar or includes_in_situ or includes_borderline
         )
-        includes_similar = CancerScopeDetector._detect_pattern(
-            text_lower, CancerScopeDetector.SIMILAR_CANCER_PATTERNS
-        )
-        includes_in_situ = CancerScopeDetector._detect_pattern(
-            text_lower, CancerScopeDetector.IN_SITU_PATTERNS
+        if not has_any_match:
+            return _no_scope_evidence()
+
+        # Build evidence spans (AH-4: include evidence_type)
+        evidence_spans = [_scope_evidence_span(
+            policy_span.document_id, policy_span.page, policy_span.span_text, type_result
+        )]
+
+        return CancerScopeEvidence(
+            includes_general=includes_general,
+            includes_similar=includes_similar,
+            includes_in_situ=includes_in_situ,
+            includes_borderline=includes_borderline,
+            evidence_spans=evidence_spans,
+            confidence="evidence_strong",
         )
-        includes_borderline = CancerScopeDetector._detect_pattern(
-            text_lower, CancerScopeDetector.BORDERLINE_PATTERNS
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _detect_scope_flags(policy_text: str) -> ScopeFlags:
+        """
+        Text-only part of detect_scope_from_text() (no span metadata).
+
+        Returns:
+            (includes_general, includes_similar, includes_in_situ,
+             includes_borderline, evidence type result or None)
+
+        Cached per text: boilerplate chunks repeat across pages/documents and
+        the same policy chunks are scanned for every coverage.
+        """
+        # No lower(): keywords are Korean literals or KCD codes expanded
+        # in both cases
+
+        # Quick reject: no anchor → no keyword, skip typing and all patterns
+        if not _has_scope_anchor(policy_text):
+            return _NO_SCOPE_FLAGS
+
+        # Detect inclusions (initial broad detection, one keyword pass)
+        mask = _SCOPE_KEYWORD_MATCHER.mask(policy_text)
+        includes_general = bool(mask & _SCOPE_KW_GENERAL) or (
+            bool(mask & _SCOPE_KW_GENERAL_RANGE)
+            and CancerScopeDetector._GENERAL_RANGE_RE.search(policy_text) is not None
         )
+        includes_similar = bool(mask & _SCOPE_KW_SIMILAR)
+        includes_in_situ = bool(mask & _SCOPE_KW_IN_SITU)
+        includes_borderline = bool(mask & _SCOPE_KW_BORDERLINE)
+
+        # Rules below only clear flags → nothing detected means nothing to type
+        if not (includes_general or includes_similar or includes_in_situ or includes_borderline):
+            return _NO_SCOPE_FLAGS
+
+        # AH-4: Classify evidence type
+        type_result = CancerEvidenceTyper.classify_evidence(policy_text)
+        evidence_type = type_result.evidence_type
 
         # AH-4: Apply evidence type rules
         if evidence_type == CancerEvidenceType.DEFINITION_INCLUDED:
@@ -132,9 +333,10 @@ class CancerScopeDetector:
             # "제자리암 별도 지급/별도 담보"
             # → Allow sub-type flags (IN_SITU, BORDERLINE)
             # Clear parent type if mentioned in "별도" context
-            if re.search(r"유사암.*별도", text_lower) or re.search(r"별도.*유사암", text_lower):
+            # (유사암.*별도|별도.*유사암, 일반암.*별도|별도.*일반암)
+            if _on_same_line(policy_text, "유사암", "별도"):
                 includes_similar = False
-            if re.search(r"일반암.*별도", text_lower) or re.search(r"별도.*일반암", text_lower):
+            if _on_same_line(policy_text, "일반암", "별도"):
                 includes_general = False
 
         elif evidence_type == CancerEvidenceType.EXCLUSION:
@@ -143,15 +345,14 @@ class CancerScopeDetector:
 
         else:  # UNKNOWN
             # Apply conservative "별도" filter
-            if re.search(r"유사암.*별도", text_lower) or re.search(r"별도.*유사암", text_lower):
+            if _on_same_line(policy_text, "유사암", "별도"):
                 includes_similar = False
-            if re.search(r"일반암.*별도", text_lower) or re.search(r"별도.*일반암", text_lower):
+            if _on_same_line(policy_text, "일반암", "별도"):
                 includes_general = False
 
-        # Detect exclusions
-        has_exclusion = CancerScopeDetector._detect_pattern(
-            text_lower, CancerScopeDetector.EXCLUSION_PATTERNS
-        )
+        # Detect exclusions: every context rule below needs "제외", which is
+        # one of EXCLUSION_PATTERNS → a literal check gates them exactly
+        has_exclusion = "제외" in policy_text
 
         # Apply exclusion logic
         # Pattern: "[X]는 제외" or "[X] 제외" or "단, [X]"
@@ -159,59 +360,30 @@ class CancerScopeDetector:
         if has_exclusion:
             # Check for exclusion patterns with context
             # "유사암은 제외", "유사암 제외", "유사암(C73, C44)은 제외"
-            if re.search(r"유사암[^\)]*제외", text_lower) or re.search(r"유사암.*은\s*제외", text_lower):
+            # (유사암[^\)]*제외|유사암.*은\s*제외)
+            if _excluded_after(policy_text, "유사암", "유사암"):
                 includes_similar = False
 
             # "제자리암은 제외", "제자리암 제외", "제자리암(D00-D09)은 제외"
-            if re.search(r"제자리암[^\)]*제외", text_lower) or re.search(r"제자리암.*은\s*제외", text_lower):
+            # (제자리암[^\)]*제외|제자리암.*은\s*제외)
+            if _excluded_after(policy_text, "제자리암", "제자리암"):
                 includes_in_situ = False
 
             # "경계성종양은 제외", "경계성종양 제외", "경계성종양(D37-D48)은 제외"
-            if re.search(r"경계성종양[^\)]*제외", text_lower) or re.search(r"경계성.*은\s*제외", text_lower):
+            # (경계성종양[^\)]*제외|경계성.*은\s*제외)
+            if _excluded_after(policy_text, "경계성종양", "경계성"):
                 includes_borderline = False
 
-        # Determine confidence
-        has_any_match = any([
+        return (
             includes_general,
             includes_similar,
             includes_in_situ,
             includes_borderline,
-        ])
-
-        confidence = "evidence_strong" if has_any_match else "unknown"
-
-        # Build evidence spans (AH-4: include evidence_type)
-        evidence_spans = [{
-            "doc_id": policy_span.document_id,
-            "doc_type": "policy",
-            "page": policy_span.page,
-            "span_text": policy_span.span_text,
-            "rule_id": "cancer_scope_detector_v2_ah4",
-            "evidence_type": evidence_type.value,
-            "type_confidence": type_result.confidence,
-            "type_matched_pattern": type_result.matched_pattern,
-        }] if has_any_match else None
-
-        return CancerScopeEvidence(
-            includes_general=includes_general,
-            includes_similar=includes_similar,
-            includes_in_situ=includes_in_situ,
-            includes_borderline=includes_borderline,
-            evidence_spans=evidence_spans,
-            confidence=confidence,
+            type_result,
         )
 
     @staticmethod
-    def _detect_pattern(text: str, patterns: List[str]) -> bool:
-        """
-        Detect if any pattern matches in text.
-        """
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
-
-    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def extract_hint_from_coverage_name(coverage_name_raw: str) -> NameBasedHint:
         """
         Extract hint from coverage name (NOT a final decision).
@@ -227,21 +399,20 @@ class CancerScopeDetector:
         Example:
         - "유사암 진단비(제자리암)" → mentions_similar=True, mentions_in_situ=True
         - "암진단비(유사암제외)" → mentions_general=True, mentions_exclusion=True
-        """
-        name_lower = coverage_name_raw.lower().replace(" ", "")
 
-        hint = NameBasedHint(raw_name=coverage_name_raw)
+        Cached per coverage name (names repeat across insurers/rows).
+        """
+        mask = coverage_name_keyword_mask(coverage_name_raw)
 
         # Detect mentions (NOT final decision)
-        hint.mentions_similar = "유사암" in name_lower
-        hint.mentions_in_situ = "제자리암" in name_lower
-        hint.mentions_borderline = "경계성종양" in name_lower or "경계성" in name_lower
-        hint.mentions_general = "암진단" in name_lower or "일반암" in name_lower
-        hint.mentions_exclusion = any([
-            "유사암제외" in name_lower,
-            "유사암 제외" in name_lower,
-            "4대유사암제외" in name_lower,
-        ])
+        hint = NameBasedHint(
+            mentions_in_situ=bool(mask & NAME_KW_IN_SITU),
+            mentions_borderline=bool(mask & NAME_KW_BORDERLINE),
+            mentions_similar=bool(mask & NAME_KW_SIMILAR),
+            mentions_general=bool(mask & NAME_KW_GENERAL),
+            mentions_exclusion=bool(mask & NAME_KW_SIMILAR_EXCLUDED),
+            raw_name=coverage_name_raw,
+        )
 
         return hint
 
@@ -273,17 +444,9 @@ def build_scope_evidence_from_policy(
     if not policy_documents:
         return None
 
-    detector = CancerScopeDetector()
-    all_evidence_spans = []
-
-    # Aggregate flags from all matching policy chunks
-    includes_general = False
-    includes_similar = False
-    includes_in_situ = False
-    includes_borderline = False
-
+    # Extract required fields (chunks without doc id / page / text are skipped)
+    chunks = []
     for doc in policy_documents:
-        # Extract required fields
         doc_id = doc.get("document_id") or doc.get("doc_id")
         page = doc.get("page")
         text = doc.get("text") or doc.get("span_text") or doc.get("content", "")
@@ -291,41 +454,102 @@ def build_scope_evidence_from_policy(
         if not doc_id or page is None or not text:
             continue
 
-        # Build span
-        span = PolicyTextSpan(
-            document_id=doc_id,
-            page=page,
-            span_text=text,
-            section=doc.get("section"),
-        )
+        chunks.append((doc_id, page, text))
 
-        # Detect scope from this span
-        evidence = detector.detect_scope_from_text(text, span)
-
-        # Aggregate flags
-        if evidence.includes_general:
-            includes_general = True
-        if evidence.includes_similar:
-            includes_similar = True
-        if evidence.includes_in_situ:
-            includes_in_situ = True
-        if evidence.includes_borderline:
-            includes_borderline = True
-
-        # Collect evidence spans
-        if evidence.evidence_spans:
-            all_evidence_spans.extend(evidence.evidence_spans)
+    try:
+        aggregated = _aggregate_policy_chunks(tuple(chunks))
+    except TypeError:
+        # Unhashable doc id / page → aggregate without the cache
+        aggregated = _aggregate_policy_chunks.__wrapped__(tuple(chunks))
 
     # If no evidence found, return None
-    if not all_evidence_spans:
+    if aggregated is None:
         return None
 
-    # Build aggregated evidence
+    includes_general, includes_similar, includes_in_situ, includes_borderline, spans = aggregated
+
+    # Build aggregated evidence (fresh evidence/span dicts: callers attach
+    # hints and the cached spans must stay untouched)
     return CancerScopeEvidence(
         includes_general=includes_general,
         includes_similar=includes_similar,
         includes_in_situ=includes_in_situ,
         includes_borderline=includes_borderline,
-        evidence_spans=all_evidence_spans,
-        confidence="evidence_strong" if all_evidence_spans else "unknown",
+        evidence_spans=[dict(span) for span in spans],
+        confidence="evidence_strong",
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _aggregate_policy_chunks(
+    chunks: Tuple[Tuple[Any, Any, str], ...]
+) -> Optional[Tuple[bool, bool, bool, bool, Tuple[Dict[str, Any], ...]]]:
+    """
+    Aggregated scope flags + evidence spans of (doc_id, page, text) chunks.
+
+    Cached per chunk list: the same insurer's policy spans are fetched for
+    many coverages. Returns None if no chunk sets a scope.
+    """
+    detect_scope_flags = CancerScopeDetector._detect_scope_flags
+    evidence_spans = []
+
+    # Aggregate flags from all matching policy chunks
+    # (plain bool OR: chunk lists are short, an array reduction costs more)
+    includes_general = False
+    includes_similar = False
+    includes_in_situ = False
+    includes_borderline = False
+
+    for doc_id, page, text in chunks:
+        # Detect scope from this chunk (same rules as detect_scope_from_text,
+        # without building per-chunk span/evidence objects)
+        general, similar, in_situ, borderline, type_result = detect_scope_flags(text)
+        if not (general or similar or in_situ or borderline):
+            continue
+
+        # Aggregate flags
+        includes_general = includes_general or general
+        includes_similar = includes_similar or similar
+        includes_in_situ = includes_in_situ or in_situ
+        includes_borderline = includes_borderline or borderline
+
+        # Collect evidence span (span_text is the chunk text)
+        evidence_spans.append(_scope_evidence_span(doc_id, page, text, type_result))
+
+    if not evidence_spans:
+        return None
+
+    return (
+        includes_general,
+        includes_similar,
+        includes_in_situ,
+        includes_borderline,
+        tuple(evidence_spans),
     )
+
+
+def get_scope_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Hit/miss statistics of the per-text caches used by scope detection.
+    """
+    caches = {
+        "classify_evidence": CancerEvidenceTyper.classify_evidence,
+        "classify_many": CancerEvidenceTyper.classify_many,
+        "detect_scope_flags": CancerScopeDetector._detect_scope_flags,
+        "aggregate_policy_chunks": _aggregate_policy_chunks,
+        "extract_hint_from_coverage_name": CancerScopeDetector.extract_hint_from_coverage_name,
+        "coverage_name_keyword_mask": coverage_name_keyword_mask,
+    }
+    return {name: cached.cache_info()._asdict() for name, cached in caches.items()}
+
+
+def clear_scope_caches() -> None:
+    """
+    Clear the per-text caches used by scope detection (e.g. between tests).
+    """
+    CancerEvidenceTyper.classify_evidence.cache_clear()
+    CancerEvidenceTyper.classify_many.cache_clear()
+    CancerScopeDetector._detect_scope_flags.cache_clear()
+    _aggregate_policy_chunks.cache_clear()
+    CancerScopeDetector.extract_hint_from_coverage_name.cache_clear()
+    coverage_name_keyword_mask.cache_clear()
@@ -11,7 +11,9 @@ This mapper splits a single coverage instance into multiple canonical codes
 when evidence supports it.
 """
 
-from typing import List, Dict, Any, Set, Optional
+import asyncio
+from collections import Counter
+from typing import List, Dict, Any, Set, Optional, Tuple
 from dataclasses import dataclass
 
 from .cancer_canonical import (
@@ -19,14 +21,36 @@ from .cancer_canonical import (
     CancerScopeEvidence,
     split_cancer_coverage_by_scope,
     get_canonical_display_name,
+    codes_from_scope_mask,
+    scope_mask_from_codes,
+    scope_mask_values,
+    single_code_from_scope_mask,
 )
 from .cancer_scope_detector import (
     CancerScopeDetector,
     build_scope_evidence_from_policy,
 )
+from .keyword_matcher import KeywordMatcher
 
 
-@dataclass
+# Shared detector (stateless: detection is static and cached per text)
+_SCOPE_DETECTOR = CancerScopeDetector()
+
+# Max concurrent splits in split_universe_coverages()
+_SPLIT_CONCURRENCY = 16
+
+# Cancer coverage keywords (one automaton pass per coverage name)
+_CANCER_COVERAGE_MATCHER = KeywordMatcher([
+    "암",
+    "암진단",
+    "유사암",
+    "제자리암",
+    "경계성종양",
+    "악성신생물",
+])
+
+
+@dataclass(slots=True, init=False)
 class CoverageSplitResult:
     """
     Result of splitting a coverage instance into canonical codes.
@@ -38,23 +62,61 @@ class CoverageSplitResult:
 
     Fields:
     - original_coverage_name: Original coverage name from proposal
-    - decided_canonical_codes: Set of decided CancerCanonicalCode values (policy evidence required)
-    - recalled_candidates: Set of recalled canonical codes (from AH-1 Excel Alias)
+    - decided_mask: ScopeMask of decided canonical codes (policy evidence required)
+    - recalled_mask: ScopeMask of recalled canonical codes (from AH-1 Excel Alias)
     - evidence: CancerScopeEvidence used for split (None if undecided)
     - split_method: Method used (policy_evidence | undecided)
+
+    decided_canonical_codes / recalled_candidates remain available (as
+    constructor arguments and properties) as Set[CancerCanonicalCode] views
+    over the masks.
     """
 
     original_coverage_name: str
-    decided_canonical_codes: Set[CancerCanonicalCode]
-    recalled_candidates: Set[CancerCanonicalCode]
+    decided_mask: int
+    recalled_mask: int
     evidence: Optional[CancerScopeEvidence]
     split_method: str  # policy_evidence | undecided
 
+    def __init__(
+        self,
+        original_coverage_name: str,
+        decided_canonical_codes: Optional[Set[CancerCanonicalCode]] = None,
+        recalled_candidates: Optional[Set[CancerCanonicalCode]] = None,
+        evidence: Optional[CancerScopeEvidence] = None,
+        split_method: str = "undecided",
+        decided_mask: int = 0,
+        recalled_mask: int = 0,
+    ):
+        self.original_coverage_name = original_coverage_name
+        self.decided_mask = decided_mask | scope_mask_from_codes(decided_canonical_codes or ())
+        self.recalled_mask = recalled_mask | scope_mask_from_codes(recalled_candidates or ())
+        self.evidence = evidence
+        self.split_method = split_method
+
+    @property
+    def decided_canonical_codes(self) -> Set[CancerCanonicalCode]:
+        """Decided canonical codes (decoded from decided_mask)."""
+        return codes_from_scope_mask(self.decided_mask)
+
+    @decided_canonical_codes.setter
+    def decided_canonical_codes(self, codes: Set[CancerCanonicalCode]) -> None:
+        self.decided_mask = scope_mask_from_codes(codes)
+
+    @property
+    def recalled_candidates(self) -> Set[CancerCanonicalCode]:
+        """Recalled canonical codes (decoded from recalled_mask)."""
+        return codes_from_scope_mask(self.recalled_mask)
+
+    @recalled_candidates.setter
+    def recalled_candidates(self, codes: Set[CancerCanonicalCode]) -> None:
+        self.recalled_mask = scope_mask_from_codes(codes)
+
     def is_decided(self) -> bool:
         """
         Check if split is decided (has policy evidence).
         """
-        return self.split_method == "policy_evidence" and len(self.decided_canonical_codes) > 0
+        return self.split_method == "policy_evidence" and self.decided_mask != 0
 
     def is_undecided(self) -> bool:
         """
@@ -66,7 +128,8 @@ class CoverageSplitResult:
         """
         Check if split is ambiguous (multiple decided canonical codes).
         """
-        return len(self.decided_canonical_codes) > 1
+        # More than one bit set
+        return self.decided_mask & (self.decided_mask - 1) != 0
 
     def get_primary_canonical_code(self) -> Optional[CancerCanonicalCode]:
         """
@@ -75,10 +138,7 @@ class CoverageSplitResult:
         If multiple codes, returns None (ambiguous).
         If single code, returns that code.
         """
-        if len(self.decided_canonical_codes) == 1:
-            return next(iter(self.decided_canonical_codes))
-        else:
-            return None
+        return single_code_from_scope_mask(self.decided_mask)
 
 
 class CanonicalSplitMapper:
@@ -99,7 +159,7 @@ class CanonicalSplitMapper:
         Args:
             policy_store: Optional PolicyEvidenceStore for DB retrieval (AH-4)
         """
-        self.detector = CancerScopeDetector()
+        self.detector = _SCOPE_DETECTOR
         self.policy_store = policy_store
 
     async def split_coverage(
@@ -135,17 +195,9 @@ class CanonicalSplitMapper:
 
         # AH-4: Fetch policy evidence from DB if available
         if not policy_documents and self.policy_store and insurer_code:
-            try:
-                policy_documents = await self.policy_store.get_policy_spans_for_cancer(
-                    insurer_code=insurer_code,
-                    coverage_id=coverage_id,
-                    coverage_name_key=coverage_name_raw,
-                    limit=20,
-                )
-            except Exception as e:
-                # Log error but don't fail (fall back to undecided)
-                print(f"Warning: Policy evidence retrieval failed: {e}")
-                policy_documents = None
+            policy_documents = await self._fetch_policy_documents(
+                coverage_name_raw, insurer_code, coverage_id
+            )
 
         # Try policy evidence
         if policy_documents:
@@ -160,7 +212,7 @@ class CanonicalSplitMapper:
                 return CoverageSplitResult(
                     original_coverage_name=coverage_name_raw,
                     decided_canonical_codes=codes,
-                    recalled_candidates=recalled_candidates or set(),
+                    recalled_candidates=recalled_candidates,
                     evidence=evidence,
                     split_method="policy_evidence",
                 )
@@ -179,53 +231,95 @@ class CanonicalSplitMapper:
 
         return CoverageSplitResult(
             original_coverage_name=coverage_name_raw,
-            decided_canonical_codes=set(),  # Empty = undecided
-            recalled_candidates=recalled_candidates or set(),
+            decided_canonical_codes=None,  # Empty = undecided
+            recalled_candidates=recalled_candidates,
             evidence=undecided_evidence,
             split_method="undecided",
         )
 
-    def split_universe_coverages(
-        self, universe_coverages: List[Dict[str, Any]]
+    async def _fetch_policy_documents(
+        self,
+        coverage_name_raw: str,
+        insurer_code: str,
+        coverage_id: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Policy spans for a coverage from policy_store (None if retrieval fails).
+        """
+        try:
+            return await self.policy_store.get_policy_spans_for_cancer(
+                insurer_code=insurer_code,
+                coverage_id=coverage_id,
+                coverage_name_key=coverage_name_raw,
+                limit=20,
+            )
+        except Exception as e:
+            # Log error but don't fail (fall back to undecided)
+            print(f"Warning: Policy evidence retrieval failed: {e}")
+            return None
+
+    async def split_universe_coverages(
+        self,
+        universe_coverages: List[Dict[str, Any]],
+        max_concurrency: int = _SPLIT_CONCURRENCY,
+        fetch_policy_evidence: bool = False,
     ) -> List[CoverageSplitResult]:
         """
         Split all coverages in universe.
 
         Args:
             universe_coverages: List of coverage records from universe
+            max_concurrency: Max number of policy evidence fetches in flight
+            fetch_policy_evidence: If True, fetch evidence for each record's
+                "insurer" via policy_store (AH-4)
 
         Returns:
-            List of CoverageSplitResult
-        """
-        results = []
+            List of CoverageSplitResult (same order as universe_coverages)
 
+        Policy evidence retrieval is I/O-bound → each distinct (name, insurer)
+        is fetched once, concurrently on the event loop. Every row is then
+        split on its own (rule matching is cached per text), so each row gets
+        its own result instance.
+        """
+        # Only split cancer-related coverages
+        cancer_coverages = []
         for coverage in universe_coverages:
             coverage_name = coverage.get("coverage_name_raw", "")
-
-            # Only split cancer-related coverages
-            if not self._is_cancer_coverage(coverage_name):
-                continue
-
-            result = self.split_coverage(coverage_name)
-            results.append(result)
-
-        return results
+            if self._is_cancer_coverage(coverage_name):
+                insurer_code = coverage.get("insurer") if fetch_policy_evidence else None
+                cancer_coverages.append((coverage_name, insurer_code))
+
+        # Fetch each distinct (name, insurer) once (names repeat across rows)
+        documents_by_coverage: Dict[Tuple[str, str], Optional[List[Dict[str, Any]]]] = {}
+        if self.policy_store:
+            fetch_coverages = list(dict.fromkeys(
+                coverage for coverage in cancer_coverages if coverage[1]
+            ))
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_one(coverage_name: str, insurer_code: str):
+                async with semaphore:
+                    return await self._fetch_policy_documents(coverage_name, insurer_code)
+
+            fetched = await asyncio.gather(
+                *(fetch_one(coverage_name, insurer_code) for coverage_name, insurer_code in fetch_coverages)
+            )
+            documents_by_coverage = dict(zip(fetch_coverages, fetched))
+
+        return [
+            await self.split_coverage(
+                coverage_name,
+                policy_documents=documents_by_coverage.get((coverage_name, insurer_code)),
+            )
+            for coverage_name, insurer_code in cancer_coverages
+        ]
 
     def _is_cancer_coverage(self, coverage_name: str) -> bool:
         """
         Check if coverage is cancer-related.
         """
-        cancer_keywords = [
-            "암",
-            "암진단",
-            "유사암",
-            "제자리암",
-            "경계성종양",
-            "악성신생물",
-        ]
-
-        name_lower = coverage_name.lower()
-        return any(keyword in name_lower for keyword in cancer_keywords)
+        # Keywords are Hangul → lower() cannot change a match
+        return _CANCER_COVERAGE_MATCHER.search(coverage_name)
 
 
 def generate_split_report(
@@ -245,16 +339,15 @@ def generate_split_report(
     }
     """
     total = len(split_results)
-    split_by_method = {}
+    split_by_method: Counter = Counter()
+    decided_masks: Counter = Counter()
     decided = 0
     undecided = 0
     ambiguous = 0
-    canonical_dist = {}
 
     for result in split_results:
         # Count by method
-        method = result.split_method
-        split_by_method[method] = split_by_method.get(method, 0) + 1
+        split_by_method[result.split_method] += 1
 
         # Count decided/undecided
         if result.is_decided():
@@ -266,16 +359,21 @@ def generate_split_report(
         if result.is_ambiguous():
             ambiguous += 1
 
-        # Count by canonical code (decided only)
-        for code in result.decided_canonical_codes:
-            code_str = code.value
-            canonical_dist[code_str] = canonical_dist.get(code_str, 0) + 1
+        # Count decided ScopeMasks (expanded to codes once, below)
+        if result.decided_mask:
+            decided_masks[result.decided_mask] += 1
+
+    # Count by canonical code (decided only): at most 15 distinct masks
+    canonical_dist: Counter = Counter()
+    for mask, count in decided_masks.items():
+        for code_str in scope_mask_values(mask):
+            canonical_dist[code_str] += count
 
     return {
         "total_coverages": total,
-        "split_by_method": split_by_method,
+        "split_by_method": dict(split_by_method),
         "decided_count": decided,
         "undecided_count": undecided,
         "ambiguous_count": ambiguous,
-        "canonical_distribution": canonical_dist,
+        "canonical_distribution": dict(canonical_dist),
     }
@@ -13,12 +13,71 @@ from psycopg2.extensions import connection as PGConnection
 
 from .alias_index import AliasIndex, get_alias_index
 from .universe_recall import UniverseRecaller
-from .policy_evidence_store import PolicyEvidenceStore
+from .policy_evidence_store import PolicyEvidenceStore, CANCER_KEYWORD_PATTERNS
 from .cancer_evidence_typer import CancerEvidenceTyper
-from .cancer_canonical import CancerCanonicalCode
+from .cancer_canonical import (
+    CancerCanonicalCode,
+    is_cancer_canonical_code,
+    scope_mask_from_codes,
+)
 from .cancer_decision import CancerCanonicalDecision, DecisionStatus, CancerCompareContext
 
 
+# Cancer keyword filter: PolicyEvidenceStore.CANCER_KEYWORDS as ILIKE patterns,
+# bound as one text[] parameter (a single ILIKE ANY predicate)
+_CANCER_EVIDENCE_SQL = """
+SELECT
+    source_doc_id,
+    source_page,
+    excerpt,
+    canonical_coverage_code,
+    evidence_type
+FROM v2.coverage_evidence
+WHERE insurer_code = %s
+  AND source_doc_type = 'policy'
+  AND excerpt ILIKE ANY(%s)
+ORDER BY source_page ASC
+LIMIT 50
+"""
+
+# Same filter for several insurers in one round-trip
+# (per-insurer LIMIT kept with row_number over each insurer partition)
+_CANCER_EVIDENCE_BATCH_SQL = """
+SELECT
+    insurer_code,
+    source_doc_id,
+    source_page,
+    excerpt,
+    canonical_coverage_code,
+    evidence_type
+FROM (
+    SELECT
+        insurer_code,
+        source_doc_id,
+        source_page,
+        excerpt,
+        canonical_coverage_code,
+        evidence_type,
+        row_number() OVER (PARTITION BY insurer_code ORDER BY source_page ASC) AS rn
+    FROM v2.coverage_evidence
+    WHERE insurer_code = ANY(%s)
+      AND source_doc_type = 'policy'
+      AND excerpt ILIKE ANY(%s)
+) ranked
+WHERE rn <= 50
+ORDER BY insurer_code, source_page ASC
+"""
+
+# SEPARATE_BENEFIT rules: keyword (+ "진단") → code
+_SEPARATE_BENEFIT_RULES = (
+    ("제자리암", CancerCanonicalCode.IN_SITU),
+    ("경계성종양", CancerCanonicalCode.BORDERLINE),
+)
+
+# Shared typer (stateless: classification is static and cached per text)
+_EVIDENCE_TYPER = CancerEvidenceTyper()
+
+
 class CancerCompareIntegration:
     """
     Cancer Canonical Decision integration for /compare endpoint.
@@ -49,7 +108,7 @@ class CancerCompareIntegration:
         self.conn = conn
         self.alias_index = alias_index or get_alias_index()
         self.policy_store = policy_store or PolicyEvidenceStore(conn)
-        self.evidence_typer = CancerEvidenceTyper()
+        self.evidence_typer = _EVIDENCE_TYPER
 
     def resolve_cancer_canonical(
         self,
@@ -79,25 +138,37 @@ class CancerCompareIntegration:
         # Step 1: Recall from Excel Alias
         recalled = self._recall_from_alias(query)
 
-        # Step 2: Initialize decision
+        # Step 2: Fetch policy evidence
+        # Note: PolicyEvidenceStore is async (uses asyncpg)
+        # For sync usage (psycopg2), we query v2.coverage_evidence directly
+        evidence_spans = self._fetch_cancer_evidence_sync(insurer_code)
+
+        # Step 3-4: Type evidence and decide
+        return self._resolve_with_spans(query, insurer_code, recalled, evidence_spans)
+
+    def _resolve_with_spans(
+        self,
+        query: str,
+        insurer_code: str,
+        recalled: Set[CancerCanonicalCode],
+        evidence_spans: List[Dict[str, Any]],
+    ) -> CancerCanonicalDecision:
+        """
+        Decision body of resolve_cancer_canonical() for already fetched
+        evidence spans (no DB access).
+        """
         decision = CancerCanonicalDecision(
             coverage_name_raw=query,
             insurer_code=insurer_code,
-            recalled_candidates=recalled,
+            recalled_mask=scope_mask_from_codes(recalled),
         )
 
-        # Step 3: Fetch policy evidence
-        # Note: PolicyEvidenceStore is async (uses asyncpg)
-        # For sync usage (psycopg2), we query v2.coverage_evidence directly
-        evidence_spans = self._fetch_cancer_evidence_sync(insurer_code)
-
         if not evidence_spans:
             # No evidence → UNDECIDED
             decision.decision_status = DecisionStatus.UNDECIDED
             decision.decision_method = "no_policy_evidence"
             return decision
 
-        # Step 4: Type evidence and decide
         decided_codes, typed_spans = self._decide_from_evidence(
             query=query,
             evidence_spans=evidence_spans,
@@ -105,7 +176,7 @@ class CancerCompareIntegration:
         )
 
         if decided_codes:
-            decision.decided_canonical_codes = decided_codes
+            decision.decided_mask = scope_mask_from_codes(decided_codes)
             decision.decision_status = DecisionStatus.DECIDED
             decision.decision_method = "policy_evidence"
             decision.decision_evidence_spans = [
@@ -142,10 +213,17 @@ class CancerCompareIntegration:
         """
         context = CancerCompareContext(query=query)
 
+        # Alias recall depends on the query only, evidence is fetched for
+        # all insurers in one query
+        recalled = self._recall_from_alias(query)
+        evidence_by_insurer = self._fetch_cancer_evidence_batch(insurer_codes)
+
         for insurer_code in insurer_codes:
-            decision = self.resolve_cancer_canonical(
+            decision = self._resolve_with_spans(
                 query=query,
                 insurer_code=insurer_code,
+                recalled=recalled,
+                evidence_spans=evidence_by_insurer.get(insurer_code, []),
             )
             context.decisions.append(decision)
 
@@ -161,35 +239,8 @@ class CancerCompareIntegration:
         Returns:
             List of evidence spans with doc_id, page, span_text
         """
-        cancer_keywords = [
-            "암", "악성신생물", "유사암", "갑상선암", "기타피부암",
-            "제자리암", "상피내암", "경계성종양",
-            "C00", "C97", "D00", "D09", "D37", "D48", "C73", "C44",
-        ]
-
-        # Build keyword filter
-        keyword_conditions = " OR ".join(
-            [f"excerpt ILIKE %s" for _ in cancer_keywords]
-        )
-        keyword_params = [f"%{kw}%" for kw in cancer_keywords]
-
-        query = f"""
-        SELECT
-            source_doc_id,
-            source_page,
-            excerpt,
-            canonical_coverage_code,
-            evidence_type
-        FROM v2.coverage_evidence
-        WHERE insurer_code = %s
-          AND source_doc_type = 'policy'
-          AND ({keyword_conditions})
-        ORDER BY source_page ASC
-        LIMIT 50
-        """
-
         with self.conn.cursor() as cur:
-            cur.execute(query, [insurer_code] + keyword_params)
+            cur.execute(_CANCER_EVIDENCE_SQL, (insurer_code, CANCER_KEYWORD_PATTERNS))
             rows = cur.fetchall()
 
         evidence_spans = []
@@ -205,6 +256,41 @@ class CancerCompareIntegration:
 
         return evidence_spans
 
+    def _fetch_cancer_evidence_batch(
+        self,
+        insurer_codes: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch cancer policy evidence for several insurers in one round-trip.
+
+        Args:
+            insurer_codes: Insurer codes (e.g., ["SAMSUNG", "MERITZ"])
+
+        Returns:
+            insurer_code → evidence spans (same spans and order as
+            _fetch_cancer_evidence_sync; insurers without evidence are absent)
+        """
+        unique_codes = list(dict.fromkeys(insurer_codes))
+        if not unique_codes:
+            return {}
+
+        with self.conn.cursor() as cur:
+            cur.execute(_CANCER_EVIDENCE_BATCH_SQL, (unique_codes, CANCER_KEYWORD_PATTERNS))
+            rows = cur.fetchall()
+
+        evidence_by_insurer: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            insurer_code, source_doc_id, source_page, excerpt, canonical_coverage_code, evidence_type = row
+            evidence_by_insurer.setdefault(insurer_code, []).append({
+                "doc_id": source_doc_id,
+                "page": source_page,
+                "span_text": excerpt,
+                "canonical_coverage_code": canonical_coverage_code,
+                "evidence_type": evidence_type,
+            })
+
+        return evidence_by_insurer
+
     def _recall_from_alias(self, query: str) -> Set[CancerCanonicalCode]:
         """
         Recall canonical codes from Excel alias index.
@@ -218,17 +304,12 @@ class CancerCompareIntegration:
         # Use AliasIndex to get recalled canonical codes
         recalled_canonical_strs = self.alias_index.resolve_query(query, apply_cancer_guardrail=True)
 
-        # Convert to CancerCanonicalCode enum
-        recalled_codes = set()
-        for code_str in recalled_canonical_strs:
-            try:
-                code = CancerCanonicalCode(code_str)
-                recalled_codes.add(code)
-            except ValueError:
-                # Not a cancer canonical code, skip
-                pass
-
-        return recalled_codes
+        # Convert to CancerCanonicalCode enum (non-cancer canonical codes are skipped)
+        return {
+            CancerCanonicalCode(code_str)
+            for code_str in recalled_canonical_strs
+            if is_cancer_canonical_code(code_str)
+        }
 
     def _decide_from_evidence(
         self,
@@ -246,7 +327,7 @@ class CancerCompareIntegration:
 
         Args:
             query: User query
-            evidence_spans: List of policy evidence spans
+            evidence_spans: List of policy evidence spans (typed in place)
             recalled_candidates: Recalled canonical codes from alias
 
         Returns:
@@ -255,16 +336,15 @@ class CancerCompareIntegration:
             - typed_spans: List of evidence spans with evidence_type classification
         """
         # Type all evidence spans
-        typed_spans = []
-        for span in evidence_spans:
-            evidence_result = self.evidence_typer.classify_evidence(
-                policy_text=span["span_text"]
-            )
-            typed_span = span.copy()
-            typed_span["evidence_type"] = evidence_result.evidence_type.value
-            typed_span["evidence_confidence"] = evidence_result.confidence
-            typed_span["matched_pattern"] = evidence_result.matched_pattern
-            typed_spans.append(typed_span)
+        evidence_results = self.evidence_typer.classify_many(
+            tuple(span["span_text"] for span in evidence_spans)
+        )
+        # Spans are this call's own fetched dicts → typed in place (no copy)
+        for span, evidence_result in zip(evidence_spans, evidence_results):
+            span["evidence_type"] = evidence_result.evidence_type.value
+            span["evidence_confidence"] = evidence_result.confidence
+            span["matched_pattern"] = evidence_result.matched_pattern
+        typed_spans = evidence_spans
 
         # Decide based on evidence types
         decided = set()
@@ -303,13 +383,18 @@ class CancerCompareIntegration:
 
             span_text = span["span_text"]
 
-            # Check for IN_SITU separate benefit
-            if "제자리암" in span_text and "진단" in span_text:
-                codes.add(CancerCanonicalCode.IN_SITU)
+            # Both rules require "진단" (checked once per span)
+            if "진단" not in span_text:
+                continue
+
+            # Check for IN_SITU / BORDERLINE separate benefit
+            for keyword, code in _SEPARATE_BENEFIT_RULES:
+                if keyword in span_text:
+                    codes.add(code)
 
-            # Check for BORDERLINE separate benefit
-            if "경계성종양" in span_text and "진단" in span_text:
-                codes.add(CancerCanonicalCode.BORDERLINE)
+            if len(codes) == len(_SEPARATE_BENEFIT_RULES):
+                # Every code is decided, remaining spans cannot add one
+                break
 
         return codes
 
@@ -334,11 +419,16 @@ class CancerCompareIntegration:
             span_text = span["span_text"]
 
             # Check for SIMILAR definition
-            if "유사암" in span_text:
+            has_similar = "유사암" in span_text
+            if has_similar:
                 codes.add(CancerCanonicalCode.SIMILAR)
 
             # Check for GENERAL definition
-            if "일반암" in span_text or ("암" in span_text and "유사암" not in span_text):
+            if "일반암" in span_text or (not has_similar and "암" in span_text):
                 codes.add(CancerCanonicalCode.GENERAL)
 
+            if len(codes) == 2:
+                # SIMILAR and GENERAL both decided
+                break
+
         return codes
@@ -0,0 +1,146 @@
+"""
+Keyword Matcher: Deterministic multi-keyword substring matching
+
+Constitutional Principle:
+- Pure literal matching (no fuzzy/LLM)
+- Same answer regardless of backend
+
+Backend:
+- pyahocorasick (optional): one Aho–Corasick automaton, O(n) scan of the text
+  regardless of keyword count
+- Fallback: compiled alternation regex (search) / `in` checks (matched)
+- first(): ordered `in` checks for short text (early exit beats building
+  automaton hits), automaton pass for long text
+- KeywordMaskMatcher: keyword → bit flags, OR-ed over all hits in one pass
+"""
+
+import re
+from typing import FrozenSet, Iterable, Mapping, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Text length from which first() scans with the automaton instead of
+# per-keyword `in` checks (measured crossover for ~20 short keywords)
+_AUTOMATON_MIN_TEXT = 256
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword literal matcher built once (at module load) and reused.
+
+    Usage:
+        matcher = KeywordMatcher(["유사암", "제자리암"])
+        matcher.search("유사암진단비")   # True
+        matcher.matched("유사암진단비")  # frozenset({"유사암"})
+        matcher.first("제자리암/유사암")  # "유사암" (declaration order wins)
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # Deduplicate, keep declaration order, drop empty keywords
+        self.keywords = tuple(dict.fromkeys(kw for kw in keywords if kw))
+
+        self._automaton = None
+        self._regex = None
+
+        if not self.keywords:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for order, keyword in enumerate(self.keywords):
+                automaton.add_word(keyword, (order, keyword))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._regex = re.compile(
+                '|'.join(re.escape(kw) for kw in self.keywords)
+            )
+
+    def search(self, text: str) -> bool:
+        """
+        True if any keyword occurs in text (stops at the first hit).
+        """
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        if self._regex is not None:
+            return self._regex.search(text) is not None
+        return False
+
+    def matched(self, text: str) -> FrozenSet[str]:
+        """
+        All keywords occurring in text (overlapping keywords included).
+        """
+        if self._automaton is not None:
+            return frozenset(keyword for _, (_, keyword) in self._automaton.iter(text))
+        return frozenset(kw for kw in self.keywords if kw in text)
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Earliest-declared keyword occurring in text (None if no keyword occurs).
+
+        Same answer as checking the keywords one by one in declaration order.
+        """
+        if self._automaton is not None and len(text) >= _AUTOMATON_MIN_TEXT:
+            hit = min((value for _, value in self._automaton.iter(text)), default=None)
+            return hit[1] if hit is not None else None
+        for keyword in self.keywords:
+            if keyword in text:
+                return keyword
+        return None
+
+
+class KeywordMaskMatcher:
+    """
+    Literal keyword → bit flags matcher: one pass reports every flag whose
+    keywords occur in the text.
+
+    Usage:
+        matcher = KeywordMaskMatcher({"유사암": 2, "C73": 2, "제자리암": 4})
+        matcher.mask("유사암(C73) 및 제자리암")  # 6
+
+    The scan stops as soon as every flag is set.
+    """
+
+    def __init__(self, keyword_bits: Mapping[str, int]):
+        # Same keyword listed twice → flags are combined
+        combined = {}
+        for keyword, bits in keyword_bits.items():
+            if keyword:
+                combined[keyword] = combined.get(keyword, 0) | bits
+        self.keyword_bits = combined
+
+        self._full_mask = 0
+        for bits in combined.values():
+            self._full_mask |= bits
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and combined:
+            automaton = ahocorasick.Automaton()
+            for keyword, bits in combined.items():
+                automaton.add_word(keyword, bits)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def mask(self, text: str) -> int:
+        """
+        OR of the flags of all keywords occurring in text (0 if none).
+        """
+        full_mask = self._full_mask
+        mask = 0
+        if self._automaton is not None:
+            for _, bits in self._automaton.iter(text):
+                mask |= bits
+                if mask == full_mask:
+                    break
+            return mask
+        for keyword, bits in self.keyword_bits.items():
+            if bits & ~mask and keyword in text:
+                mask |= bits
+                if mask == full_mask:
+                    break
+        return mask
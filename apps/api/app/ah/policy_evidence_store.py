@@ -86,13 +86,9 @@ class PolicyEvidenceStore:
         4. Sort: keyword_hits DESC, page ASC
         5. Limit results
         """
-        # Build keyword filter (OR condition)
-        keyword_conditions = " OR ".join(
-            [f"span_text ILIKE '%{kw}%'" for kw in self.CANCER_KEYWORDS]
-        )
-
-        # Base query
-        query = f"""
+        # Base query (keyword patterns bound as one text[] parameter:
+        # filter = ILIKE ANY, score = number of distinct keywords matched)
+        query = """
         WITH keyword_scored AS (
             SELECT
                 document_id,
@@ -101,17 +97,19 @@ class PolicyEvidenceStore:
                 section,
                 -- Count keyword hits for scoring
                 (
-                    {' + '.join([f"CASE WHEN span_text ILIKE '%{kw}%' THEN 1 ELSE 0 END" for kw in self.CANCER_KEYWORDS])}
+                    SELECT count(*)
+                    FROM unnest($2::text[]) AS kw(pattern)
+                    WHERE span_text ILIKE kw.pattern
                 ) AS keyword_hits
             FROM v2.coverage_evidence
             WHERE
                 doc_type = 'policy'
                 AND insurer_code = $1
-                AND ({keyword_conditions})
+                AND span_text ILIKE ANY($2::text[])
         """
 
-        params = [insurer_code]
-        param_idx = 2
+        params = [insurer_code, CANCER_KEYWORD_PATTERNS]
+        param_idx = 3
 
         # Optional coverage_id filter
         if coverage_id:
@@ -144,16 +142,18 @@ class PolicyEvidenceStore:
         async with self.db_pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
 
-        # Convert to dict list
-        results = []
-        for row in rows:
-            results.append({
-                "doc_id": row["doc_id"],
-                "page": row["page"],
-                "text": row["text"],
-                "section": row.get("section"),
-                "keyword_hits": row["keyword_hits"],
-            })
+        # Convert to dict list (positional access: columns are selected in
+        # this fixed order above)
+        results = [
+            {
+                "doc_id": row[0],
+                "page": row[1],
+                "text": row[2],
+                "section": row[3],
+                "keyword_hits": row[4],
+            }
+            for row in rows
+        ]
 
         return results
 
@@ -180,6 +180,11 @@ class PolicyEvidenceStore:
         )
 
 
+# ILIKE patterns for CANCER_KEYWORDS (bound as a query parameter, never
+# formatted into the SQL text; shared with the compare integration)
+CANCER_KEYWORD_PATTERNS = [f"%{kw}%" for kw in PolicyEvidenceStore.CANCER_KEYWORDS]
+
+
 async def create_policy_evidence_store(db_pool: asyncpg.Pool) -> PolicyEvidenceStore:
     """
     Factory function to create PolicyEvidenceStore.
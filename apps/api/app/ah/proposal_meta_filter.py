@@ -26,7 +26,7 @@ class ProposalMetaFilter:
     - Conservative: if unsure, keep the row (false positive > false negative)
     """
 
-    # Meta row patterns (case-insensitive)
+    # Meta row patterns (no cased characters → matched without case folding)
     META_PATTERNS = [
         r"^합계$",
         r"^소계$",
@@ -60,6 +60,14 @@ class ProposalMetaFilter:
         r"비용",
     ]
 
+    # Coverage terms that keep a row without a required keyword
+    EXCEPTION_KEYWORDS = ("암", "질병", "상해", "사망", "장해", "연금")
+
+    # Pre-compiled alternations (one scan per rule instead of one per pattern;
+    # is_meta_row runs per proposal/universe row)
+    _META_RE = re.compile("|".join(META_PATTERNS))
+    _COVERAGE_NAME_REQUIRED_RE = re.compile("|".join(COVERAGE_NAME_REQUIRED_PATTERNS))
+
     @staticmethod
     def is_meta_row(coverage_name_raw: Optional[str]) -> bool:
         """
@@ -89,25 +97,22 @@ class ProposalMetaFilter:
             return True
 
         # Rule 3: Check meta patterns
-        name_lower = name.lower().replace(" ", "")
-        for pattern in ProposalMetaFilter.META_PATTERNS:
-            if re.search(pattern, name_lower, re.IGNORECASE):
-                return True
+        # No lower(): meta patterns and coverage keywords have no cased characters
+        name_compact = name.replace(" ", "")
+        if ProposalMetaFilter._META_RE.search(name_compact):
+            return True
 
         # Rule 4: Check if it contains any coverage keywords
         # If it doesn't, it's likely a meta row
-        has_coverage_keyword = False
-        for pattern in ProposalMetaFilter.COVERAGE_NAME_REQUIRED_PATTERNS:
-            if re.search(pattern, name_lower):
-                has_coverage_keyword = True
-                break
+        has_coverage_keyword = (
+            ProposalMetaFilter._COVERAGE_NAME_REQUIRED_RE.search(name_compact) is not None
+        )
 
         # Conservative: if no coverage keyword, treat as meta
         # (This might filter some valid rows, but prevents pollution)
         if not has_coverage_keyword:
             # Exception: if it contains "암" or "질병" or other common terms, keep it
-            exception_keywords = ["암", "질병", "상해", "사망", "장해", "연금"]
-            for keyword in exception_keywords:
+            for keyword in ProposalMetaFilter.EXCEPTION_KEYWORDS:
                 if keyword in name:
                     return False  # Keep this row
             return True  # Filter out
@@ -135,18 +140,15 @@ class ProposalMetaFilter:
             }
         """
         total = len(rows)
-        filtered_rows = []
-        filtered_count = 0
+        is_meta_row = ProposalMetaFilter.is_meta_row
 
-        for row in rows:
-            coverage_name = row.get("coverage_name_raw") or row.get("coverage_name")
-            if ProposalMetaFilter.is_meta_row(coverage_name):
-                filtered_count += 1
-                # Skip this row (meta row)
-            else:
-                filtered_rows.append(row)
+        filtered_rows = [
+            row for row in rows
+            if not is_meta_row(row.get("coverage_name_raw") or row.get("coverage_name"))
+        ]
 
         kept = len(filtered_rows)
+        filtered_count = total - kept
 
         stats = {
             "total_rows": total,
@@ -170,5 +172,5 @@ def apply_meta_filter_to_universe(
     Returns:
         Tuple of (filtered_rows, stats)
     """
-    filter = ProposalMetaFilter()
-    return filter.filter_proposal_rows(universe_rows)
+    # Static filter → no instance needed
+    return ProposalMetaFilter.filter_proposal_rows(universe_rows)
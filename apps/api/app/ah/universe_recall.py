@@ -12,11 +12,21 @@ Guarantees:
 - Unmapped queries logged, not silently ignored
 """
 
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Sequence
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from .alias_index import get_alias_index
+from .alias_normalizer import AliasNormalizer
+
+# Universe CSV column dtypes (insurer: few distinct codes → categorical).
+# All columns are loaded: recalled coverage records carry every column.
+_UNIVERSE_DTYPES = {'insurer': 'category'}
+
+# Empty row selection (query codes absent from the universe)
+_NO_ROWS = np.empty(0, dtype=np.int64)
 
 
 class UniverseRecaller:
@@ -47,9 +57,29 @@ class UniverseRecaller:
         if not universe_csv_path.exists():
             raise FileNotFoundError(f"Universe CSV not found: {universe_csv_path}")
 
-        self.universe_df = pd.read_csv(universe_csv_path)
+        self.universe_df = pd.read_csv(universe_csv_path, dtype=_UNIVERSE_DTYPES)
         self.alias_index = get_alias_index()
 
+        # Inverted index: canonical code → sorted universe row positions,
+        # resolved once (raw names never change after load)
+        code_rows: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self.universe_df['coverage_name_raw'].tolist()):
+            for code in self._resolve_raw_name(str(name).strip()):
+                code_rows[code].append(position)
+        self._code_rows: Dict[str, np.ndarray] = {
+            code: np.asarray(positions, dtype=np.int64)
+            for code, positions in code_rows.items()
+        }
+        # Insurer filter compares categorical codes (ints), not strings
+        insurers = self.universe_df['insurer'].cat
+        self._insurer_categories = insurers.categories
+        self._insurer_codes = insurers.codes.to_numpy()
+
+        # Row values as native-Python tuples (column order), so recall builds
+        # records with dict(zip()) instead of DataFrame.to_dict('records')
+        self._columns = tuple(self.universe_df.columns)
+        self._row_values = list(zip(*(self.universe_df[col].tolist() for col in self._columns)))
+
     def recall_from_query(
         self,
         query: str,
@@ -93,27 +123,28 @@ class UniverseRecaller:
         # Step 2: Canonical Codes → Universe Recall
         # We need to map canonical codes back to universe coverage_name_raw
         # Since universe doesn't have canonical_code column yet,
-        # we use alias matching via normalized names
-
-        recalled = []
-        for _, row in self.universe_df.iterrows():
-            insurer = row['insurer']
+        # we use alias matching via normalized names (resolved per row in __init__)
 
-            # Apply insurer filter
-            if insurer_filter and insurer not in insurer_filter:
-                continue
+        code_rows = [self._code_rows[code] for code in canonical_codes if code in self._code_rows]
+        # unique() sorts → rows keep universe order
+        row_positions = np.unique(np.concatenate(code_rows)) if code_rows else _NO_ROWS
 
-            coverage_name_raw = str(row['coverage_name_raw']).strip()
+        # Apply insurer filter
+        if insurer_filter:
+            filter_codes = self._insurer_categories.get_indexer(list(insurer_filter))
+            row_positions = row_positions[
+                np.isin(self._insurer_codes[row_positions], filter_codes[filter_codes >= 0])
+            ]
 
-            # Check if this raw name matches any canonical code
-            if self._matches_canonical_codes(coverage_name_raw, canonical_codes):
-                recalled.append(row.to_dict())
+        columns = self._columns
+        row_values = self._row_values
+        recalled = [dict(zip(columns, row_values[position])) for position in row_positions.tolist()]
 
         insurers_covered = sorted(set(r['insurer'] for r in recalled))
 
         return {
             "query": query,
-            "canonical_codes": canonical_codes,
+            "canonical_codes": list(canonical_codes),
             "recall_count": len(recalled),
             "recalled_coverages": recalled,
             "insurers_covered": insurers_covered,
@@ -121,7 +152,7 @@ class UniverseRecaller:
         }
 
     def _matches_canonical_codes(
-        self, coverage_name_raw: str, canonical_codes: List[str]
+        self, coverage_name_raw: str, canonical_codes: Sequence[str]
     ) -> bool:
         """
         Check if raw coverage name matches any canonical code.
@@ -131,14 +162,18 @@ class UniverseRecaller:
         2. Lookup in alias_index
         3. Check if resolved canonical codes intersect with target canonical_codes
         """
-        from .alias_normalizer import AliasNormalizer
-
-        normalized = AliasNormalizer.normalize(coverage_name_raw)
-        resolved_codes = self.alias_index.index.get(normalized, set())
+        resolved_codes = self._resolve_raw_name(coverage_name_raw)
 
         # Check intersection
         return bool(set(resolved_codes) & set(canonical_codes))
 
+    def _resolve_raw_name(self, coverage_name_raw: str) -> Sequence[str]:
+        """
+        Canonical codes of a raw coverage name (normalized alias lookup).
+        """
+        normalized = AliasNormalizer.normalize(coverage_name_raw)
+        return self.alias_index.index.get(normalized, ())
+
     def get_coverage_stats(self) -> Dict[str, int]:
         """
         Get universe statistics.
@@ -149,6 +184,25 @@ class UniverseRecaller:
         }
 
 
+# Singleton instance
+_GLOBAL_UNIVERSE_RECALLER: Optional[UniverseRecaller] = None
+
+
+def get_universe_recaller() -> UniverseRecaller:
+    """
+    Get global singleton UniverseRecaller instance (default universe CSV).
+
+    Lazy-loads on first access; the recaller is read-only after __init__,
+    so one instance is shared by all callers.
+    """
+    global _GLOBAL_UNIVERSE_RECALLER
+
+    if _GLOBAL_UNIVERSE_RECALLER is None:
+        _GLOBAL_UNIVERSE_RECALLER = UniverseRecaller()
+
+    return _GLOBAL_UNIVERSE_RECALLER
+
+
 def recall_universe_from_query(
     query: str,
     insurer_filter: Optional[List[str]] = None,
@@ -165,7 +219,7 @@ def recall_universe_from_query(
     Returns:
         Recall result dict
     """
-    recaller = UniverseRecaller()
+    recaller = get_universe_recaller()
     return recaller.recall_from_query(
         query,
         insurer_filter=insurer_filter,
@@ -21,6 +21,7 @@ from .rules import (
     detect_cancer_subtypes,
     detect_comparison_focus,
     resolve_coverage_domain,
+    detect_query_domain,
     get_main_coverage_priority,
     SurgeryMethod,
     CancerSubtype,
@@ -62,20 +63,13 @@ def compile_request(input_data: CompileInput) -> CompileOutput:
         trace.append(f"  → Comparison basis: {input_data.selected_comparison_basis}")
     else:
         # Try to infer from query using deterministic rules
-        detected_domain = None
-        for coverage_name, domain in [
-            ("암진단비", "cancer"),
-            ("일반암진단비", "cancer"),
-            ("수술비", "surgery"),
-        ]:
-            if coverage_name in input_data.user_query:
-                detected_domain = domain
-                main_coverage = get_main_coverage_priority(domain)
-                if main_coverage:
-                    selected_slots["comparison_basis"] = main_coverage[0]
-                    trace.append(f"  → Auto-detected domain: {domain}")
-                    trace.append(f"  → Using main coverage: {main_coverage[0]}")
-                break
+        detected_domain = detect_query_domain(input_data.user_query)
+        if detected_domain:
+            main_coverage = get_main_coverage_priority(detected_domain)
+            if main_coverage:
+                selected_slots["comparison_basis"] = main_coverage[0]
+                trace.append(f"  → Auto-detected domain: {detected_domain}")
+                trace.append(f"  → Using main coverage: {main_coverage[0]}")
 
         if not detected_domain:
             warnings.append("No comparison basis specified and could not auto-detect")
@@ -166,7 +160,8 @@ def detect_clarification_needed(query: str, insurers: Optional[List[str]] = None
 
     # Check for surgery method keywords
     surgery_method = detect_surgery_method(query)
-    if any(kw in query.lower() for kw in ["다빈치", "로봇", "복강경"]):
+    # Hangul keywords → no lower() copy of the query
+    if any(kw in query for kw in ["다빈치", "로봇", "복강경"]):
         if not surgery_method or surgery_method == SurgeryMethod.UNKNOWN:
             required_selections.append({
                 "type": "surgery_method",
@@ -176,7 +171,7 @@ def detect_clarification_needed(query: str, insurers: Optional[List[str]] = None
 
     # Check for cancer subtype keywords
     cancer_subtypes = detect_cancer_subtypes(query)
-    if any(kw in query.lower() for kw in ["제자리암", "경계성", "유사암"]):
+    if any(kw in query for kw in ["제자리암", "경계성", "유사암"]):
         if len(cancer_subtypes) > 1:
             required_selections.append({
                 "type": "cancer_subtypes",
@@ -8,10 +8,15 @@ Constitutional Principles:
 - No recommendation/judgment
 """
 
-from typing import Dict, List, Set, Optional
+import functools
+from typing import Dict, FrozenSet, List, Set, Optional
 from enum import Enum
 
 
+# Max number of distinct queries whose detection results are kept
+_DETECT_CACHE_SIZE = 2048
+
+
 class SurgeryMethod(str, Enum):
     """Surgery method options (deterministic)."""
     DA_VINCI = "da_vinci"
@@ -64,6 +69,14 @@ COVERAGE_DOMAIN_RULES: Dict[str, str] = {
 }
 
 
+# Query keywords for comparison basis auto-detection, checked in order
+# (first match wins; a subset of COVERAGE_DOMAIN_RULES pinned by RULE_VERSION)
+QUERY_DOMAIN_KEYWORDS = (
+    ("암진단비", "cancer"),
+    ("수술비", "surgery"),
+)
+
+
 # Surgery method keywords (deterministic pattern matching)
 SURGERY_METHOD_KEYWORDS: Dict[str, List[str]] = {
     "da_vinci": ["다빈치", "da vinci", "davinci"],
@@ -81,6 +94,28 @@ CANCER_SUBTYPE_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
+# Flattened (keyword, enum member) pairs in declaration order, built once at
+# import (one flat scan per query, no Enum lookup per hit)
+_SURGERY_METHOD_KEYWORD_MEMBERS = tuple(
+    (keyword, SurgeryMethod(method))
+    for method, keywords in SURGERY_METHOD_KEYWORDS.items()
+    for keyword in keywords
+)
+_CANCER_SUBTYPE_KEYWORD_MEMBERS = tuple(
+    (keyword, CancerSubtype(subtype))
+    for subtype, keywords in CANCER_SUBTYPE_KEYWORDS.items()
+    for keyword in keywords
+)
+
+# Comparison focus keywords, checked in priority order
+_COMPARISON_FOCUS_KEYWORDS = (
+    (ComparisonFocus.AMOUNT, ("금액", "얼마", "보장금액", "지급금액")),
+    (ComparisonFocus.DEFINITION, ("정의", "범위", "무엇", "어떤")),
+    (ComparisonFocus.CONDITION, ("조건", "요건", "면책", "한도")),
+)
+
+
+@functools.lru_cache(maxsize=_DETECT_CACHE_SIZE)
 def detect_surgery_method(query: str) -> Optional[SurgeryMethod]:
     """
     Detect surgery method from query (deterministic).
@@ -89,14 +124,14 @@ def detect_surgery_method(query: str) -> Optional[SurgeryMethod]:
         query: User query string
 
     Returns:
-        SurgeryMethod enum or None
+        SurgeryMethod enum or None (cached per query)
     """
     query_lower = query.lower()
 
-    for method, keywords in SURGERY_METHOD_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query_lower:
-                return SurgeryMethod(method)
+    # First method (declaration order) with a matching keyword
+    for keyword, method in _SURGERY_METHOD_KEYWORD_MEMBERS:
+        if keyword in query_lower:
+            return method
 
     return None
 
@@ -109,19 +144,26 @@ def detect_cancer_subtypes(query: str) -> Set[CancerSubtype]:
         query: User query string
 
     Returns:
-        Set of CancerSubtype enums
+        Set of CancerSubtype enums (a fresh copy of the cached result)
     """
-    query_lower = query.lower()
-    detected = set()
+    return set(_detect_cancer_subtypes_cached(query))
 
-    for subtype, keywords in CANCER_SUBTYPE_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query_lower:
-                detected.add(CancerSubtype(subtype))
 
-    return detected
+@functools.lru_cache(maxsize=_DETECT_CACHE_SIZE)
+def _detect_cancer_subtypes_cached(query: str) -> FrozenSet[CancerSubtype]:
+    """
+    Cached body of detect_cancer_subtypes() (frozen → safe to share).
+    """
+    query_lower = query.lower()
+
+    return frozenset(
+        subtype
+        for keyword, subtype in _CANCER_SUBTYPE_KEYWORD_MEMBERS
+        if keyword in query_lower
+    )
 
 
+@functools.lru_cache(maxsize=_DETECT_CACHE_SIZE)
 def detect_comparison_focus(query: str) -> Optional[ComparisonFocus]:
     """
     Detect comparison focus from query (deterministic).
@@ -130,21 +172,15 @@ def detect_comparison_focus(query: str) -> Optional[ComparisonFocus]:
         query: User query string
 
     Returns:
-        ComparisonFocus enum or None
+        ComparisonFocus enum or None (cached per query)
     """
     query_lower = query.lower()
 
-    # Amount-related keywords
-    if any(kw in query_lower for kw in ["금액", "얼마", "보장금액", "지급금액"]):
-        return ComparisonFocus.AMOUNT
-
-    # Definition-related keywords
-    if any(kw in query_lower for kw in ["정의", "범위", "무엇", "어떤"]):
-        return ComparisonFocus.DEFINITION
-
-    # Condition-related keywords
-    if any(kw in query_lower for kw in ["조건", "요건", "면책", "한도"]):
-        return ComparisonFocus.CONDITION
+    # Amount → definition → condition (first focus with a keyword wins)
+    for focus, keywords in _COMPARISON_FOCUS_KEYWORDS:
+        for keyword in keywords:
+            if keyword in query_lower:
+                return focus
 
     return None
 
@@ -162,6 +198,23 @@ def resolve_coverage_domain(coverage_name: str) -> Optional[str]:
     return COVERAGE_DOMAIN_RULES.get(coverage_name)
 
 
+def detect_query_domain(query: str) -> Optional[str]:
+    """
+    Detect coverage domain from query for comparison basis (deterministic).
+
+    Args:
+        query: User query string
+
+    Returns:
+        Domain of the first QUERY_DOMAIN_KEYWORDS entry found in the query, or None
+    """
+    for coverage_name, domain in QUERY_DOMAIN_KEYWORDS:
+        if coverage_name in query:
+            return domain
+
+    return None
+
+
 def get_main_coverage_priority(domain: str) -> List[str]:
     """
     Get main coverage priority for domain (deterministic).
@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .routers import products, compare, evidence, view_model, compile
 from .admin_mapping import router as admin_mapping_router
+from .admin_mapping.integration import start_event_writer, stop_event_writer
 from .db import close_async_pool
 
 app = FastAPI(
@@ -70,7 +71,14 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Start background mapping event writer (events carry their target pool)"""
+    start_event_writer()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Cleanup async database pool on shutdown"""
+    """Flush pending mapping events, then cleanup async database pool on shutdown"""
+    await stop_event_writer()
     await close_async_pool()
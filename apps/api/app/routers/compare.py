@@ -2,6 +2,7 @@
 /compare endpoint - AH-6: Cancer Canonical Decision Integration
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from psycopg2.extensions import connection as PGConnection
 from typing import Optional, Dict, Any, List
 from ..schemas.compare import (
@@ -31,6 +32,7 @@ from ..contracts import (
 )
 from ..ah.compare_integration import CancerCompareIntegration
 from ..ah.cancer_decision import CancerCanonicalDecision, DecisionStatus
+from ..ah.cancer_canonical import codes_from_scope_mask
 
 router = APIRouter(tags=["Compare"])
 
@@ -67,22 +69,21 @@ async def compare_proposals(
         cancer_integration = CancerCompareIntegration(conn=conn)
 
         # Step 3: Resolve cancer canonical decisions for all insurers
-        compare_context = cancer_integration.resolve_compare_context(
+        # (blocking psycopg2 query → worker thread, the event loop keeps
+        # serving concurrent requests)
+        compare_context = await run_in_threadpool(
+            cancer_integration.resolve_compare_context,
             query=request.query,
             insurer_codes=insurers,
         )
 
-        # Step 4: Check if we have any DECIDED codes
-        all_decided = all(d.is_decided() for d in compare_context.decisions)
-        any_decided = any(d.is_decided() for d in compare_context.decisions)
-
-        # Step 5: Get canonical codes for comparison (DECIDED only)
-        canonical_codes_for_compare = set()
-        for decision in compare_context.decisions:
-            # Constitutional Rule: ONLY DECIDED codes are used for comparison
-            canonical_codes_for_compare.update(
-                code.value for code in decision.get_canonical_codes_for_compare()
-            )
+        # Step 4-5: Get canonical codes for comparison (DECIDED only)
+        # (empty when no decision is DECIDED → checked below)
+        # Constitutional Rule: ONLY DECIDED codes are used for comparison
+        canonical_codes_for_compare = {
+            code.value
+            for code in codes_from_scope_mask(compare_context.get_scope_mask_for_compare())
+        }
 
         # If no DECIDED codes, we cannot compare
         if not canonical_codes_for_compare:
@@ -339,6 +340,9 @@ def _build_undecided_response(
     Returns:
         ProposalCompareResponse with UNDECIDED status
     """
+    context_dict = compare_context.to_dict()
+    stats = context_dict["stats"]
+
     return ProposalCompareResponse(
         query=request.query,
         comparison_result="undecided",
@@ -350,10 +354,10 @@ def _build_undecided_response(
         message="약관 근거 부족으로 담보 확정 불가",
         ux_message_code="CANCER_CANONICAL_UNDECIDED",
         debug={
-            "cancer_canonical_decision": compare_context.to_dict(),
-            "decided_count": compare_context.get_decided_count(),
-            "undecided_count": compare_context.get_undecided_count(),
-            "decided_rate": compare_context.get_decided_rate(),
+            "cancer_canonical_decision": context_dict,
+            "decided_count": stats["decided_count"],
+            "undecided_count": stats["undecided_count"],
+            "decided_rate": stats["decided_rate"],
             "reason": "All cancer canonical decisions are UNDECIDED (no policy evidence)",
         }
     )
@@ -8,6 +8,7 @@ B. "유사암진단비" → CA_DIAG_SIMILAR only
 """
 
 import sys
+import asyncio
 from pathlib import Path
 import pandas as pd
 
@@ -261,7 +262,7 @@ def generate_overall_report():
     print(f"Total cancer coverages in universe: {len(cancer_coverages)}")
 
     # Split all
-    split_results = mapper.split_universe_coverages(cancer_coverages)
+    split_results = asyncio.run(mapper.split_universe_coverages(cancer_coverages))
 
     # Generate report
     report = generate_split_report(split_results)
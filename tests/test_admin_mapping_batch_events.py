@@ -0,0 +1,212 @@
+"""
+Test: Batched mapping event writes (AdminMappingService.create_or_update_events)
+Constitutional: Same deduplication as create_or_update_event
+
+NOTE: These tests require a running PostgreSQL database with the admin_mapping tables.
+Run migration first: migrations/step_next7_admin_mapping_workbench.sql
+"""
+
+import pytest
+import pytest_asyncio
+import asyncpg
+import os
+from apps.api.app.admin_mapping.service import AdminMappingService
+from apps.api.app.admin_mapping.models import (
+    CreateMappingEventRequest,
+    MappingEventData,
+    DetectedStatus,
+    EventState,
+)
+
+
+# Test configuration
+TEST_DB_CONFIG = {
+    "host": os.getenv("POSTGRES_HOST", "localhost"),
+    "port": int(os.getenv("POSTGRES_PORT", "5433")),
+    "user": os.getenv("POSTGRES_USER", "postgres"),
+    "password": os.getenv("POSTGRES_PASSWORD", "testpass"),
+    "database": os.getenv("POSTGRES_DB", "inca_rag_final_test"),
+}
+
+
+@pytest_asyncio.fixture
+async def db_pool():
+    """Create test database pool"""
+    pool = await asyncpg.create_pool(**TEST_DB_CONFIG)
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture
+async def admin_service(db_pool):
+    """Create admin service instance"""
+    return AdminMappingService(db_pool)
+
+
+@pytest_asyncio.fixture
+async def clean_tables(db_pool):
+    """Clean test events before each test"""
+    async with db_pool.acquire() as conn:
+        await conn.execute("DELETE FROM mapping_event_queue WHERE insurer IN ('BATCH_A', 'BATCH_B')")
+
+
+async def _open_events(db_pool, insurer):
+    async with db_pool.acquire() as conn:
+        return await conn.fetch(
+            """
+            SELECT id, query_text, raw_coverage_title, detected_status, candidate_coverage_codes
+            FROM mapping_event_queue
+            WHERE insurer = $1 AND state = 'OPEN'
+            ORDER BY raw_coverage_title, detected_status
+            """,
+            insurer,
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_insert_returns_ids_in_key_order(admin_service, db_pool, clean_tables):
+    """
+    Test: New events are inserted (RETURNING id) and ids come back in first-seen key order
+    """
+    requests = [
+        MappingEventData(
+            insurer="BATCH_A",
+            query_text="유사암진단비",
+            raw_coverage_title="유사암 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+            candidate_coverage_codes=["CA_DIAG_SIMILAR"],
+        ),
+        MappingEventData(
+            insurer="BATCH_A",
+            query_text="암진단비",
+            raw_coverage_title="암 진단비",
+            detected_status=DetectedStatus.AMBIGUOUS,
+        ),
+    ]
+
+    event_ids = await admin_service.create_or_update_events(requests)
+
+    assert len(event_ids) == 2
+    assert event_ids[0] != event_ids[1]
+
+    first = await admin_service.get_event_detail(event_ids[0])
+    assert first.raw_coverage_title == "유사암 진단비"
+    assert first.state == EventState.OPEN
+    second = await admin_service.get_event_detail(event_ids[1])
+    assert second.raw_coverage_title == "암 진단비"
+
+    rows = await _open_events(db_pool, "BATCH_A")
+    assert len(rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_deduplicates_within_batch(admin_service, db_pool, clean_tables):
+    """
+    Test: Same (insurer, raw_coverage_title, detected_status) in one batch → one OPEN event,
+    last request wins (as with sequential create_or_update_event calls)
+    """
+    requests = [
+        MappingEventData(
+            insurer="BATCH_A",
+            query_text="first query",
+            raw_coverage_title="일반암 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+        ),
+        MappingEventData(
+            insurer="BATCH_A",
+            query_text="last query",
+            raw_coverage_title="일반암 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+        ),
+    ]
+
+    event_ids = await admin_service.create_or_update_events(requests)
+
+    assert len(event_ids) == 1
+    rows = await _open_events(db_pool, "BATCH_A")
+    assert len(rows) == 1
+    assert rows[0]["id"] == event_ids[0]
+    assert rows[0]["query_text"] == "last query"
+
+
+@pytest.mark.asyncio
+async def test_batch_updates_existing_open_event(admin_service, db_pool, clean_tables):
+    """
+    Test: An existing OPEN event is updated in place (same id), new keys are inserted
+    """
+    existing_id = await admin_service.create_or_update_event(
+        CreateMappingEventRequest(
+            insurer="BATCH_B",
+            query_text="old query",
+            raw_coverage_title="제자리암 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+        )
+    )
+
+    event_ids = await admin_service.create_or_update_events([
+        MappingEventData(
+            insurer="BATCH_B",
+            query_text="new query",
+            raw_coverage_title="제자리암 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+            candidate_coverage_codes=["CA_DIAG_IN_SITU"],
+        ),
+        MappingEventData(
+            insurer="BATCH_B",
+            query_text="경계성종양진단비",
+            raw_coverage_title="경계성종양 진단비",
+            detected_status=DetectedStatus.UNMAPPED,
+        ),
+    ])
+
+    assert event_ids[0] == existing_id
+    assert event_ids[1] != existing_id
+
+    updated = await admin_service.get_event_detail(existing_id)
+    assert updated.query_text == "new query"
+    assert updated.state == EventState.OPEN
+
+    rows = await _open_events(db_pool, "BATCH_B")
+    assert len(rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_sequential_writes(admin_service, db_pool, clean_tables):
+    """
+    Test: Batch result equals the result of sequential create_or_update_event calls
+    """
+    requests = [
+        MappingEventData(
+            insurer="BATCH_A",
+            query_text=f"query {i}",
+            raw_coverage_title=f"담보 {i % 3}",
+            detected_status=DetectedStatus.UNMAPPED,
+        )
+        for i in range(7)
+    ]
+
+    await admin_service.create_or_update_events(requests)
+    batch_rows = [
+        (row["raw_coverage_title"], row["query_text"])
+        for row in await _open_events(db_pool, "BATCH_A")
+    ]
+
+    async with db_pool.acquire() as conn:
+        await conn.execute("DELETE FROM mapping_event_queue WHERE insurer = 'BATCH_A'")
+
+    for request in requests:
+        await admin_service.create_or_update_event(request)
+    sequential_rows = [
+        (row["raw_coverage_title"], row["query_text"])
+        for row in await _open_events(db_pool, "BATCH_A")
+    ]
+
+    assert batch_rows == sequential_rows
+
+
+@pytest.mark.asyncio
+async def test_batch_empty_is_noop(admin_service):
+    """
+    Test: Empty batch returns no ids without touching the database
+    """
+    assert await admin_service.create_or_update_events([]) == []
@@ -0,0 +1,132 @@
+"""
+Unit tests for AliasIndex pickle snapshots (save_snapshot / load_snapshot)
+
+A snapshot is only used when it is fresh and of the current format;
+anything else falls back to the Excel build without raising.
+"""
+
+import logging
+import os
+import pickle
+
+import pytest
+
+from apps.api.app.ah import alias_index as alias_index_module
+from apps.api.app.ah.alias_index import AliasIndex, _SNAPSHOT_VERSION
+
+
+def _built_index() -> AliasIndex:
+    index = AliasIndex()
+    index.index = {"유사암진단비": ("A4210",), "암진단비": ("A4200_1", "A4210")}
+    index.canonical_to_display = {"A4200_1": "암진단비(유사암제외)", "A4210": "유사암진단비"}
+    index.cancer_canonical_codes = frozenset({"A4200_1", "A4210"})
+    index._loaded = True
+    return index
+
+
+@pytest.fixture
+def excel_path(tmp_path):
+    path = tmp_path / "mapping.xlsx"
+    path.write_bytes(b"excel")
+    return path
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, excel_path):
+    path = tmp_path / "mapping.pkl"
+    _built_index().save_snapshot(path)
+    return path
+
+
+def _set_mtime(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+
+def test_fresh_snapshot_round_trip(snapshot_path, excel_path):
+    loaded = AliasIndex()
+
+    assert loaded.load_snapshot(snapshot_path, excel_path) is True
+
+    expected = _built_index()
+    assert loaded.index == expected.index
+    assert loaded.canonical_to_display == expected.canonical_to_display
+    assert loaded.cancer_canonical_codes == expected.cancer_canonical_codes
+    assert loaded.resolve_query("유사암진단비", apply_cancer_guardrail=False) == ("A4210",)
+
+
+def test_snapshot_older_than_excel_is_stale(snapshot_path, excel_path):
+    _set_mtime(excel_path, snapshot_path.stat().st_mtime + 10)
+    loaded = AliasIndex()
+
+    assert loaded.load_snapshot(snapshot_path, excel_path) is False
+    assert loaded.index == {}
+    assert loaded._loaded is False
+
+
+def test_snapshot_older_than_sources_is_stale(snapshot_path, excel_path, monkeypatch):
+    newer_source = snapshot_path.with_name("alias_normalizer.py")
+    newer_source.write_text("# changed")
+    _set_mtime(newer_source, snapshot_path.stat().st_mtime + 10)
+    monkeypatch.setattr(alias_index_module, "_SNAPSHOT_SOURCES", (newer_source,))
+
+    assert AliasIndex().load_snapshot(snapshot_path, excel_path) is False
+
+
+def test_snapshot_version_mismatch(snapshot_path, excel_path):
+    _, *rest = pickle.loads(snapshot_path.read_bytes())
+    snapshot_path.write_bytes(pickle.dumps((_SNAPSHOT_VERSION - 1, *rest)))
+    loaded = AliasIndex()
+
+    assert loaded.load_snapshot(snapshot_path, excel_path) is False
+    assert loaded._loaded is False
+
+
+@pytest.mark.parametrize("payload", [
+    b"",                                          # empty file
+    b"not a pickle",                              # corrupt
+    pickle.dumps((_SNAPSHOT_VERSION, {}))[:-5],   # truncated write
+    pickle.dumps((_SNAPSHOT_VERSION, {})),        # wrong layout
+    pickle.dumps(None),                           # not a tuple
+])
+def test_corrupt_or_partial_snapshot(snapshot_path, excel_path, payload):
+    snapshot_path.write_bytes(payload)
+    loaded = AliasIndex()
+
+    assert loaded.load_snapshot(snapshot_path, excel_path) is False
+    assert loaded._loaded is False
+
+
+def test_missing_snapshot(tmp_path, excel_path):
+    assert AliasIndex().load_snapshot(tmp_path / "missing.pkl", excel_path) is False
+
+
+def test_save_snapshot_requires_loaded_index(tmp_path):
+    with pytest.raises(RuntimeError):
+        AliasIndex().save_snapshot(tmp_path / "mapping.pkl")
+
+
+def test_snapshot_write_failure_is_logged(monkeypatch, caplog):
+    """
+    get_alias_index(): a failed snapshot write (e.g. read-only data dir)
+    is logged and the Excel-built index is still returned.
+    """
+    def load_from_excel(self, excel_path):
+        built = _built_index()
+        self.index = built.index
+        self.canonical_to_display = built.canonical_to_display
+        self.cancer_canonical_codes = built.cancer_canonical_codes
+        self._loaded = True
+
+    def save_snapshot(self, snapshot_path):
+        raise PermissionError(13, "Permission denied", str(snapshot_path))
+
+    monkeypatch.setattr(alias_index_module, "_GLOBAL_ALIAS_INDEX", None)
+    monkeypatch.setattr(AliasIndex, "load_snapshot", lambda self, *args: False)
+    monkeypatch.setattr(AliasIndex, "load_from_excel", load_from_excel)
+    monkeypatch.setattr(AliasIndex, "save_snapshot", save_snapshot)
+
+    with caplog.at_level(logging.WARNING, logger=alias_index_module.__name__):
+        index = alias_index_module.get_alias_index()
+
+    assert index.index == _built_index().index
+    assert "snapshot write failed" in caplog.text
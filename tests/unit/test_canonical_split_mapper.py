@@ -0,0 +1,39 @@
+"""
+Unit tests for CanonicalSplitMapper.split_universe_coverages
+
+Repeated universe rows are split once but must not share a result instance.
+"""
+
+import pytest
+
+from apps.api.app.ah.canonical_split_mapper import CanonicalSplitMapper
+
+
+UNIVERSE = [
+    {"coverage_name_raw": "유사암진단비", "insurer": "SAMSUNG"},
+    {"coverage_name_raw": "암진단비(유사암 제외)", "insurer": "SAMSUNG"},
+    {"coverage_name_raw": "유사암진단비", "insurer": "SAMSUNG"},
+    {"coverage_name_raw": "상해입원일당", "insurer": "SAMSUNG"},
+    {"coverage_name_raw": "유사암진단비", "insurer": "MERITZ"},
+]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_rows_get_own_result():
+    results = await CanonicalSplitMapper().split_universe_coverages(UNIVERSE)
+
+    # Non-cancer row dropped, order kept
+    assert [r.original_coverage_name for r in results] == [
+        "유사암진단비", "암진단비(유사암 제외)", "유사암진단비", "유사암진단비",
+    ]
+    first, _, repeated, _ = results
+    assert repeated is not first
+    assert repeated.split_method == first.split_method
+    assert repeated.decided_mask == first.decided_mask
+    assert repeated.recalled_mask == first.recalled_mask
+
+    # Mutating one row's result leaves the other untouched
+    repeated.split_method = "policy_evidence"
+    repeated.decided_mask = 2
+    assert first.split_method == "undecided"
+    assert first.decided_mask == 0
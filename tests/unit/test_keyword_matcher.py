@@ -0,0 +1,196 @@
+"""
+Unit tests for keyword_matcher (literal multi-keyword matching)
+
+Constitutional: Same answer regardless of backend — every case runs with the
+Aho–Corasick automaton (when pyahocorasick is installed) and with the
+regex / `in` fallback, and is checked against plain `in` checks.
+"""
+
+import random
+
+import pytest
+
+from apps.api.app.ah import keyword_matcher
+from apps.api.app.ah.keyword_matcher import (
+    KeywordMatcher,
+    KeywordMaskMatcher,
+    _AUTOMATON_MIN_TEXT,
+)
+
+
+BACKENDS = [
+    pytest.param(True, id="ahocorasick", marks=pytest.mark.skipif(
+        not keyword_matcher.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed"
+    )),
+    pytest.param(False, id="fallback"),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Build matchers with the given backend (flag is read at construction)"""
+    monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", request.param)
+    return request.param
+
+
+def _expected(keywords, text):
+    """Reference answers: ordered `in` checks"""
+    keywords = [kw for kw in dict.fromkeys(keywords) if kw]
+    found = [kw for kw in keywords if kw in text]
+    return bool(found), frozenset(found), (found[0] if found else None)
+
+
+def _assert_same(matcher, keywords, text):
+    search, matched, first = _expected(keywords, text)
+    assert matcher.search(text) is search
+    assert matcher.matched(text) == matched
+    assert matcher.first(text) == first
+
+
+# Overlapping keywords: prefix / suffix / contained in each other
+OVERLAPPING = ["유사암", "암", "제자리암", "유사암진단비", "진단비", "암진단"]
+
+
+def test_backend_selected(backend):
+    matcher = KeywordMatcher(OVERLAPPING)
+    assert (matcher._automaton is not None) is backend
+
+
+@pytest.mark.parametrize("text", [
+    "유사암진단비",
+    "제자리암/유사암",
+    "일반암진단비(유사암 제외)",
+    "암",
+    "진단",
+    "경계성종양",
+    "유사암진단비유사암진단비",
+])
+def test_overlapping_keywords(backend, text):
+    _assert_same(KeywordMatcher(OVERLAPPING), OVERLAPPING, text)
+
+
+def test_first_uses_declaration_order_not_position(backend):
+    # "제자리암" is declared before "유사암" but occurs later in the text
+    keywords = ["제자리암", "유사암"]
+    matcher = KeywordMatcher(keywords)
+    short = "유사암 및 제자리암"
+    long = "유사암" + "x" * _AUTOMATON_MIN_TEXT + "제자리암"
+    assert matcher.first(short) == "제자리암"
+    assert matcher.first(long) == "제자리암"
+
+
+@pytest.mark.parametrize("length", [
+    _AUTOMATON_MIN_TEXT - 1,
+    _AUTOMATON_MIN_TEXT,
+    _AUTOMATON_MIN_TEXT + 1,
+])
+@pytest.mark.parametrize("placement", ["start", "end", "both", "none"])
+def test_automaton_threshold(backend, length, placement):
+    keywords = ["제자리암", "유사암", "암"]
+    head = {"start": "유사암", "both": "유사암"}.get(placement, "")
+    tail = {"end": "제자리암", "both": "제자리암"}.get(placement, "")
+    filler = "가" * (length - len(head) - len(tail))
+    text = head + filler + tail
+    assert len(text) == length
+    _assert_same(KeywordMatcher(keywords), keywords, text)
+
+
+def test_empty_text(backend):
+    matcher = KeywordMatcher(OVERLAPPING)
+    assert matcher.search("") is False
+    assert matcher.matched("") == frozenset()
+    assert matcher.first("") is None
+
+
+@pytest.mark.parametrize("keywords", [[], [""], ["", ""]])
+def test_empty_keywords(backend, keywords):
+    matcher = KeywordMatcher(keywords)
+    assert matcher.keywords == ()
+    for text in ["", "유사암", "가" * _AUTOMATON_MIN_TEXT]:
+        assert matcher.search(text) is False
+        assert matcher.matched(text) == frozenset()
+        assert matcher.first(text) is None
+
+
+def test_duplicate_and_empty_keywords_dropped(backend):
+    matcher = KeywordMatcher(["유사암", "", "암", "유사암"])
+    assert matcher.keywords == ("유사암", "암")
+    _assert_same(matcher, ["유사암", "암"], "유사암")
+
+
+def test_random_texts_match_reference(backend):
+    rng = random.Random(0)
+    alphabet = "암유사제자리진단비 "
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(12)]
+    matcher = KeywordMatcher(keywords)
+    for _ in range(300):
+        length = rng.choice([0, 1, 5, 40, _AUTOMATON_MIN_TEXT - 1, _AUTOMATON_MIN_TEXT, 400])
+        text = "".join(rng.choice(alphabet) for _ in range(length))
+        _assert_same(matcher, keywords, text)
+
+
+# --- KeywordMaskMatcher ---
+
+MASK_KEYWORDS = {"유사암": 2, "C73": 2, "제자리암": 4, "암": 1, "경계성종양": 8, "D0": 4 | 8}
+
+
+def _expected_mask(keyword_bits, text):
+    """Reference answer: OR of the bits of every keyword found with `in`"""
+    mask = 0
+    for keyword, bits in keyword_bits.items():
+        if keyword and keyword in text:
+            mask |= bits
+    return mask
+
+
+def test_mask_backend_selected(backend):
+    matcher = KeywordMaskMatcher(MASK_KEYWORDS)
+    assert (matcher._automaton is not None) is backend
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "유사암(C73) 및 제자리암",
+    "일반암진단비",
+    "경계성종양(D0)",
+    "갑상선암 C73",
+    "해당 없음",
+    "유사암" * 100 + "경계성종양",
+])
+def test_mask_equals_or_of_found_bits(backend, text):
+    matcher = KeywordMaskMatcher(MASK_KEYWORDS)
+    assert matcher.mask(text) == _expected_mask(MASK_KEYWORDS, text)
+
+
+def test_mask_empty_keywords(backend):
+    matcher = KeywordMaskMatcher({"": 1})
+    assert matcher.mask("") == 0
+    assert matcher.mask("유사암") == 0
+
+
+def test_mask_random_texts_match_reference(backend):
+    rng = random.Random(1)
+    alphabet = "암유사제자리C73D0 "
+    keyword_bits = {
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))): 1 << rng.randint(0, 5)
+        for _ in range(12)
+    }
+    matcher = KeywordMaskMatcher(keyword_bits)
+    for _ in range(300):
+        length = rng.choice([0, 1, 5, 40, 300])
+        text = "".join(rng.choice(alphabet) for _ in range(length))
+        assert matcher.mask(text) == _expected_mask(keyword_bits, text)
+
+
+@pytest.mark.parametrize("text", [
+    "유사암(C73, C44) 진단비",
+    "제자리암(D00~D09) 및 경계성종양(D37~D48)",
+    "일반암(C00-C97 악성신생물)",
+    "암진단비(유사암 제외)",
+    "",
+])
+def test_mask_scope_keywords(backend, text):
+    from apps.api.app.ah.cancer_scope_detector import _build_scope_keyword_matcher
+
+    matcher = _build_scope_keyword_matcher()
+    assert matcher.mask(text) == _expected_mask(matcher.keyword_bits, text)
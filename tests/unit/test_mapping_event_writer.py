@@ -0,0 +1,133 @@
+"""
+Unit tests for MappingEventWriter (background batch writer for mapping events)
+
+No database: pools and AdminMappingService are replaced with fakes.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from apps.api.app.admin_mapping import integration
+from apps.api.app.admin_mapping.integration import MappingEventWriter
+from apps.api.app.admin_mapping.models import MappingEventData, DetectedStatus
+
+
+class FakePool:
+    def __init__(self, name):
+        self.name = name
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Record (pool name, titles) per create_or_update_events call"""
+    calls = []
+
+    class FakeService:
+        instances = []
+
+        def __init__(self, db_pool):
+            self.db_pool = db_pool
+            FakeService.instances.append(self)
+
+        async def create_or_update_events(self, events, conn=None):
+            # Slow write: stop() must wait for it instead of cancelling it
+            await asyncio.sleep(0.01)
+            assert conn is self.db_pool
+            calls.append((self.db_pool.name, [e.raw_coverage_title for e in events]))
+            return []
+
+    monkeypatch.setattr(integration, "AdminMappingService", FakeService)
+    return calls
+
+
+@pytest.fixture
+def services(written):
+    """Fake services built by the writer (in creation order)"""
+    return integration.AdminMappingService.instances
+
+
+def _event(title):
+    return MappingEventData(
+        insurer="SAMSUNG",
+        query_text=title,
+        raw_coverage_title=title,
+        detected_status=DetectedStatus.UNMAPPED,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_events(written):
+    writer = MappingEventWriter(flush_interval=10)
+    writer.start()
+    pool = FakePool("a")
+    for title in ["암 진단비", "유사암 진단비", "제자리암 진단비"]:
+        writer.enqueue(pool, _event(title))
+
+    await writer.stop()
+
+    assert not writer.running
+    assert written == [("a", ["암 진단비", "유사암 진단비", "제자리암 진단비"])]
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_write(written):
+    writer = MappingEventWriter(flush_interval=0)
+    writer.start()
+    writer.enqueue(FakePool("a"), _event("암 진단비"))
+    # Let the flush task take the batch and start writing
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    await writer.stop()
+
+    assert written == [("a", ["암 진단비"])]
+
+
+@pytest.mark.asyncio
+async def test_events_written_to_their_own_pool(written):
+    writer = MappingEventWriter(flush_interval=10)
+    writer.start()
+    pool_a, pool_b = FakePool("a"), FakePool("b")
+    writer.enqueue(pool_a, _event("암 진단비"))
+    writer.enqueue(pool_b, _event("유사암 진단비"))
+    writer.enqueue(pool_a, _event("제자리암 진단비"))
+
+    await writer.stop()
+
+    assert written == [
+        ("a", ["암 진단비", "제자리암 진단비"]),
+        ("b", ["유사암 진단비"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stop_without_start_writes_queue(written):
+    writer = MappingEventWriter()
+    writer.enqueue(FakePool("a"), _event("암 진단비"))
+
+    await writer.stop()
+
+    assert written == [("a", ["암 진단비"])]
+
+
+@pytest.mark.asyncio
+async def test_service_built_once_per_pool(written, services):
+    writer = MappingEventWriter(flush_interval=0)
+    writer.start()
+    pool_a, pool_b = FakePool("a"), FakePool("b")
+    for title in ["암 진단비", "유사암 진단비", "제자리암 진단비"]:
+        writer.enqueue(pool_a, _event(title))
+        writer.enqueue(pool_b, _event(title))
+        # Separate batches
+        await asyncio.sleep(0.05)
+
+    await writer.stop()
+
+    assert len(written) == 6
+    assert [service.db_pool.name for service in services] == ["a", "b"]